@@ -1,7 +1,13 @@
 """tcpkgman - TwinCAT Package Manager Helper"""
 
-from .tcpkg import Tcpkg
-
-__version__ = "0.1.0"
+from ._version import __version__
 
 __all__ = ["Tcpkg", "__version__"]
+
+
+def __getattr__(name):
+	# Load the TcPkg wrapper (and subprocess) only when it is first accessed
+	if name == "Tcpkg":
+		from .tcpkg import Tcpkg
+		return Tcpkg
+	raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,3 @@
+"""Version of tcpkgman."""
+
+__version__ = "0.1.0"
@@ -1,8 +1,9 @@
 """ctypes wrapper for TcAdsDll.dll - Beckhoff ADS communication library."""
 
 import ctypes
+import os
+import re
 import sys
-from pathlib import Path
 
 # Type definitions
 ads_i32 = ctypes.c_long
@@ -12,6 +13,12 @@ ads_ui8 = ctypes.c_ubyte
 
 ADSERR_NOERR = 0x00
 
+# Typical TwinCAT installation location of TcAdsDll.dll
+TYPICAL_TCADS_PATH = r"C:\Program Files (x86)\Beckhoff\TwinCAT\Common64\TcAdsDll.dll"
+
+# AMS NetID: six dot-separated ASCII-digit octets, captured in one match
+_NET_ID_PATTERN = re.compile(r"([0-9]{1,3})\.([0-9]{1,3})\.([0-9]{1,3})\.([0-9]{1,3})\.([0-9]{1,3})\.([0-9]{1,3})")
+
 
 class AmsNetId(ctypes.Structure):
 	"""AMS NetID structure (6 bytes)."""
@@ -19,13 +26,16 @@ class AmsNetId(ctypes.Structure):
 
 	@staticmethod
 	def from_string(net_id: str) -> 'AmsNetId':
-		"""Parse AMS NetID from string (e.g., "192.168.1.100.1.1")."""
-		parts = [int(p) for p in net_id.split('.')]
-		if len(parts) != 6:
+		"""Parse AMS NetID from string (e.g., "192.168.1.100.1.1"), ignoring surrounding whitespace."""
+		match = _NET_ID_PATTERN.fullmatch(net_id.strip())
+		if match is None:
 			raise ValueError(f"Invalid AMS NetID format: {net_id}")
+		try:
+			raw = bytes(map(int, match.groups()))
+		except ValueError:
+			raise ValueError(f"Invalid AMS NetID format: {net_id}") from None
 		addr = AmsNetId()
-		for i in range(6):
-			addr.b[i] = parts[i]
+		ctypes.memmove(addr.b, raw, 6)
 		return addr
 
 
@@ -60,14 +70,13 @@ class TcAdsDll:
 			self._dll = ctypes.WinDLL("TcAdsDll.dll")
 		except OSError:
 			# Try typical TwinCAT installation location
-			typical_path = Path(r"C:\Program Files (x86)\Beckhoff\TwinCAT\Common64\TcAdsDll.dll")
-			if typical_path.exists():
-				self._dll = ctypes.WinDLL(str(typical_path))
+			if os.path.isfile(TYPICAL_TCADS_PATH):
+				self._dll = ctypes.WinDLL(TYPICAL_TCADS_PATH)
 			else:
 				raise FileNotFoundError(
 					"TcAdsDll.dll not found. TwinCAT Router is not installed.\n"
 					"Install TwinCAT XAE or TwinCAT ADS Runtime.\n"
-					f"Expected location: {typical_path}"
+					f"Expected location: {TYPICAL_TCADS_PATH}"
 				)
 		self._setup_functions()
 
@@ -80,26 +89,34 @@ class TcAdsDll:
 			ads_i32, ctypes.POINTER(AmsAddr), ctypes.POINTER(ads_ui16), ctypes.POINTER(ads_ui16)
 		]
 		self._dll.AdsSyncReadStateReqEx.restype = ads_i32
+		# Write data is passed as bytes (c_char_p) so no cast is needed per call
 		self._dll.AdsSyncWriteReqEx.argtypes = [
-			ads_i32, ctypes.POINTER(AmsAddr), ads_ui32, ads_ui32, ads_ui32, ctypes.c_void_p
+			ads_i32, ctypes.POINTER(AmsAddr), ads_ui32, ads_ui32, ads_ui32, ctypes.c_char_p
 		]
 		self._dll.AdsSyncWriteReqEx.restype = ads_i32
 		self._dll.AdsSyncReadWriteReqEx2.argtypes = [
 			ads_i32, ctypes.POINTER(AmsAddr), ads_ui32, ads_ui32, ads_ui32,
-			ctypes.c_void_p, ads_ui32, ctypes.c_void_p, ctypes.POINTER(ads_ui32)
+			ctypes.c_void_p, ads_ui32, ctypes.c_char_p, ctypes.POINTER(ads_ui32)
 		]
 		self._dll.AdsSyncReadWriteReqEx2.restype = ads_i32
 
+		# Bind configured functions once to skip per-call DLL attribute lookups
+		self._port_open_ex = self._dll.AdsPortOpenEx
+		self._port_close_ex = self._dll.AdsPortCloseEx
+		self._read_state_req = self._dll.AdsSyncReadStateReqEx
+		self._write_req = self._dll.AdsSyncWriteReqEx
+		self._read_write_req = self._dll.AdsSyncReadWriteReqEx2
+
 	def port_open(self) -> int:
 		"""Open ADS port."""
-		port = self._dll.AdsPortOpenEx()
+		port = self._port_open_ex()
 		if port == 0:
 			raise ADSError(0, "Failed to open ADS port")
 		return port
 
 	def port_close(self, port: int):
 		"""Close ADS port."""
-		result = self._dll.AdsPortCloseEx(port)
+		result = self._port_close_ex(port)
 		if result != ADSERR_NOERR:
 			raise ADSError(result, f"Failed to close ADS port {port}")
 
@@ -107,16 +124,15 @@ class TcAdsDll:
 		"""Read ADS state (connection check). Returns error code (0 = success)."""
 		ads_state = ads_ui16()
 		device_state = ads_ui16()
-		result = self._dll.AdsSyncReadStateReqEx(
+		result = self._read_state_req(
 			port, ctypes.byref(addr), ctypes.byref(ads_state), ctypes.byref(device_state)
 		)
 		return result
 
 	def write(self, port: int, addr: AmsAddr, index_group: int, index_offset: int, data: bytes):
 		"""Write data to ADS device."""
-		result = self._dll.AdsSyncWriteReqEx(
-			port, ctypes.byref(addr), index_group, index_offset, len(data),
-			ctypes.cast(ctypes.c_char_p(data), ctypes.c_void_p) if data else None
+		result = self._write_req(
+			port, ctypes.byref(addr), index_group, index_offset, len(data), data or None
 		)
 		if result != ADSERR_NOERR:
 			raise ADSError(result, f"Write failed (group={index_group}, offset={index_offset})")
@@ -124,17 +140,18 @@ class TcAdsDll:
 	def read_write(self, port: int, addr: AmsAddr, index_group: int, index_offset: int,
 				   read_length: int, write_data: bytes) -> bytes:
 		"""Read and write data in single ADS call."""
-		read_buffer = ctypes.create_string_buffer(read_length)
+		# ctypes array view over a bytearray: passed as void* without cast or extra copy
+		read_buffer = bytearray(read_length)
+		read_view = (ctypes.c_ubyte * read_length).from_buffer(read_buffer)
 		bytes_read = ads_ui32()
-		result = self._dll.AdsSyncReadWriteReqEx2(
+		result = self._read_write_req(
 			port, ctypes.byref(addr), index_group, index_offset, read_length,
-			ctypes.cast(read_buffer, ctypes.c_void_p), len(write_data),
-			ctypes.cast(ctypes.c_char_p(write_data), ctypes.c_void_p) if write_data else None,
+			read_view, len(write_data), write_data or None,
 			ctypes.byref(bytes_read)
 		)
 		if result != ADSERR_NOERR:
 			raise ADSError(result, f"Read/write failed (group={index_group}, offset={index_offset})")
-		return read_buffer.raw[:bytes_read.value]
+		return bytes(memoryview(read_buffer)[:bytes_read.value])
 
 
 # Singleton instance
@@ -1,11 +1,17 @@
 """Generic ADS interface for TwinCAT targets."""
 
 from contextlib import contextmanager
-import os
+from functools import lru_cache
 import struct
-import xml.etree.ElementTree as ET
 from pathlib import Path
 from .ads_dll import get_ads_dll, AmsAddr
+from .utils import getenv
+
+# Prefer lxml when installed: it filters Route elements in C during parsing
+try:
+	from lxml import etree
+except ImportError:
+	etree = None
 
 # TwinCAT System Service constants
 SYSTEMSERVICE_PORT = 10000
@@ -16,6 +22,8 @@ SYSTEMSERVICE_FWRITE = 123
 SYSTEMSERVICE_FGETSTATUS = 134
 SYSTEMSERVICE_STARTPROCESS = 500
 
+# Precompiled layout for FOPEN handle
+_HANDLE_STRUCT = struct.Struct('<I')
 
 # FOPEN mode flags
 FOPEN_READ = 1 << 0
@@ -27,6 +35,96 @@ FOPEN_OVERWRITE = 1 << 8
 FOPEN_PATH_GENERIC = 1 << 16
 
 
+@lru_cache(maxsize=32)
+def _startproc_struct(process_len: int, dir_len: int, cmdline_len: int) -> struct.Struct:
+	"""STARTPROCESS payload layout: three lengths, then three null-terminated strings."""
+	return struct.Struct(f'<III{process_len}sx{dir_len}sx{cmdline_len}sx')
+
+
+@lru_cache(maxsize=16)
+def _build_ams_addr(net_id: str, port: int) -> AmsAddr:
+	"""Build AMS address once per (net_id, port) and reuse it across ADS calls."""
+	return AmsAddr(net_id, port)
+
+
+# Route child elements read from StaticRoutes.xml
+_ROUTE_FIELDS = ("Name", "NetId", "Address")
+
+
+def _read_routes_lxml(path: str) -> dict[str, tuple[str, str]]:
+	"""Stream Route entries with lxml, clearing each element once read."""
+	routes = {}
+	for _, elem in etree.iterparse(path, events=("end",), tag="Route"):
+		name = elem.findtext("Name")
+		net_id = (elem.findtext("NetId") or "").strip()
+		address = elem.findtext("Address")
+		if name and net_id and address:
+			routes[name] = (net_id, address)
+		elem.clear()
+	return routes
+
+
+def _read_routes_expat(path: str) -> dict[str, tuple[str, str]]:
+	"""Stream Route entries with expat callbacks, without building any element objects."""
+	from xml.parsers import expat
+
+	routes = {}
+	depth = 0
+	route_depth = None
+	route = {}
+	field = None
+	text = []
+
+	def start_element(tag, attrs):
+		nonlocal depth, route_depth, route, field
+		depth += 1
+		if route_depth is None:
+			if tag == "Route":
+				route_depth = depth
+				route = {}
+		elif depth == route_depth + 1 and tag in _ROUTE_FIELDS:
+			field = tag
+			text.clear()
+
+	def end_element(tag):
+		nonlocal depth, route_depth, field
+		if field is not None and depth == route_depth + 1:
+			route[field] = "".join(text)
+			field = None
+		elif depth == route_depth:
+			name, net_id, address = (route.get(f) for f in _ROUTE_FIELDS)
+			net_id = (net_id or "").strip()
+			if name and net_id and address:
+				routes[name] = (net_id, address)
+			route_depth = None
+		depth -= 1
+
+	def char_data(data):
+		if field is not None:
+			text.append(data)
+
+	parser = expat.ParserCreate()
+	parser.StartElementHandler = start_element
+	parser.EndElementHandler = end_element
+	parser.CharacterDataHandler = char_data
+	with open(path, "rb") as f:
+		parser.ParseFile(f)
+	return routes
+
+
+def _read_routes(path: str) -> dict[str, tuple[str, str]]:
+	"""Read Route entries with lxml if installed, otherwise with expat."""
+	if etree is not None:
+		return _read_routes_lxml(path)
+	return _read_routes_expat(path)
+
+
+@lru_cache(maxsize=4)
+def _parse_routes(path: str, mtime_ns: int) -> dict[str, tuple[str, str]]:
+	"""Parse Route entries from StaticRoutes.xml, cached per (path, mtime_ns) until the file changes."""
+	return _read_routes(path)
+
+
 class ADSInterface:
 	"""Generic ADS interface for TwinCAT System Service operations."""
 
@@ -34,6 +132,22 @@ class ADSInterface:
 		"""Initialize ADS interface. Requires ADS route configured in TwinCAT Router."""
 		self.ams_net_id = ams_net_id
 		self._dll = get_ads_dll()
+		self._port = None
+		self._session_depth = 0
+
+	def __enter__(self):
+		"""Open an ADS port that is reused by all operations until exit."""
+		if self._session_depth == 0:
+			self._port = self._dll.port_open()
+		self._session_depth += 1
+		return self
+
+	def __exit__(self, exc_type, exc_value, traceback):
+		"""Close the session ADS port once the outermost session exits."""
+		self._session_depth -= 1
+		if self._session_depth == 0:
+			port, self._port = self._port, None
+			self._dll.port_close(port)
 
 	def check_connection(self) -> bool:
 		"""
@@ -45,19 +159,15 @@ class ADSInterface:
 		Raises:
 			ADSError: If connection fails with specific ADS error
 		"""
-		from .ads_dll import AmsAddr, ADSError, ADSERR_NOERR
+		from .ads_dll import ADSError, ADSERR_NOERR
 
-		port = self._dll.port_open()
-		try:
-			addr = AmsAddr(self.ams_net_id, SYSTEMSERVICE_PORT)
-			result = self._dll.read_state(port, addr)
+		with self._connect() as (dll, port, addr):
+			result = dll.read_state(port, addr)
 
 			if result == ADSERR_NOERR:
 				return True
 			else:
 				raise ADSError(result)
-		finally:
-			self._dll.port_close(port)
 
 	@staticmethod
 	def get_twincat_targets() -> dict[str, tuple[str, str]]:
@@ -75,25 +185,18 @@ class ADSInterface:
 		targets = {}
 
 		# Get path from TWINCAT3DIR environment variable
-		twincat_dir = os.environ.get("TWINCAT3DIR")
+		twincat_dir = getenv("TWINCAT3DIR")
 		if not twincat_dir:
 			return targets
 
 		routes_path = Path(twincat_dir) / "Target" / "StaticRoutes.xml"
-		if not routes_path.exists():
+		try:
+			mtime_ns = routes_path.stat().st_mtime_ns
+		except OSError:
 			return targets
 
 		try:
-			tree = ET.parse(routes_path)
-			root = tree.getroot()
-
-			# Parse each Route entry
-			for route in root.findall(".//Route"):
-				name = route.findtext("Name")
-				net_id = route.findtext("NetId")
-				address = route.findtext("Address")
-				if name and net_id and address:
-					targets[name] = (net_id, address)
+			targets = dict(_parse_routes(str(routes_path), mtime_ns))
 		except Exception:
 			pass
 
@@ -101,9 +204,13 @@ class ADSInterface:
 
 	@contextmanager
 	def _connect(self):
-		"""Connect to System Service."""
+		"""Connect to System Service, reusing the session port if one is open."""
+		addr = _build_ams_addr(self.ams_net_id, SYSTEMSERVICE_PORT)
+		if self._port is not None:
+			yield (self._dll, self._port, addr)
+			return
+
 		port = self._dll.port_open()
-		addr = AmsAddr(self.ams_net_id, SYSTEMSERVICE_PORT)
 		try:
 			yield (self._dll, port, addr)
 		finally:
@@ -115,7 +222,7 @@ class ADSInterface:
 		# Open file
 		path_bytes = path.encode('utf-8') + b'\x00'
 		result = dll.read_write(port, addr, SYSTEMSERVICE_FOPEN, mode_flags, 4, path_bytes)
-		handle = struct.unpack('<I', result)[0]
+		handle = _HANDLE_STRUCT.unpack(result)[0]
 		try:
 			yield handle
 		finally:
@@ -133,12 +240,22 @@ class ADSInterface:
 			with self._file_handle(dll, port, addr, remote_path, mode) as handle:
 				dll.read_write(port, addr, SYSTEMSERVICE_FWRITE, handle, 4, data)
 
-	def read_file(self, remote_path: str, max_size: int = 1024 * 1024) -> str:
-		"""Read file from target (up to max_size bytes)."""
+	def read_file(self, remote_path: str, max_size: int = 1024 * 1024, initial_chunk: int = 4096) -> str:
+		"""Read file from target (up to max_size bytes), doubling the read size while chunks come back full."""
 		mode = FOPEN_READ | FOPEN_BINARY | FOPEN_PATH_GENERIC
 		with self._connect() as (dll, port, addr):
 			with self._file_handle(dll, port, addr, remote_path, mode) as handle:
-				data = dll.read_write(port, addr, SYSTEMSERVICE_FREAD, handle, max_size, b'')
+				chunks = []
+				total = 0
+				chunk_size = min(initial_chunk, max_size)
+				while chunk_size > 0:
+					chunk = dll.read_write(port, addr, SYSTEMSERVICE_FREAD, handle, chunk_size, b'')
+					chunks.append(chunk)
+					total += len(chunk)
+					if len(chunk) < chunk_size:
+						break
+					chunk_size = min(chunk_size * 2, max_size - total)
+				data = b''.join(chunks)
 				return data.rstrip(b'\x00').decode('utf-8', errors='replace')
 
 	def file_exists(self, remote_path: str) -> bool:
@@ -163,8 +280,8 @@ class ADSInterface:
 			process_bytes = process_str.encode('utf-8')
 			dir_bytes = working_dir.encode('utf-8')
 			cmdline_bytes = cmdline_str.encode('utf-8')
-			data = struct.pack('<III', len(process_bytes), len(dir_bytes), len(cmdline_bytes))
-			data += process_bytes + b'\x00' + dir_bytes + b'\x00' + cmdline_bytes + b'\x00'
+			lengths = (len(process_bytes), len(dir_bytes), len(cmdline_bytes))
+			data = _startproc_struct(*lengths).pack(*lengths, process_bytes, dir_bytes, cmdline_bytes)
 
 			# Execute command
 			index_offset = (timeout_ms & 0xFFFF) | (0x10000 if hide_window else 0)
@@ -5,8 +5,10 @@ Requires manual ADS route configuration in TwinCAT Router.
 """
 
 import os
+import socket
 import subprocess
 import time
+from functools import lru_cache
 from pathlib import Path
 from .ads_interface import ADSInterface
 
@@ -17,6 +19,11 @@ class ADSSSHKeyManager(ADSInterface):
 	AUTHORIZED_KEYS_PATH = "C:/ProgramData/ssh/administrators_authorized_keys"
 	PID_FILE_PATH = "C:/ProgramData/ssh/sshd.pid"
 
+	# PID polling backoff (seconds)
+	PID_POLL_INITIAL_DELAY = 0.05
+	PID_POLL_MAX_DELAY = 0.5
+	PID_POLL_BACKOFF = 1.5
+
 	# SSH key types and names (in order of preference)
 	SSH_KEY_TYPES = [
 		("ed25519", "id_ed25519"),
@@ -44,11 +51,20 @@ class ADSSSHKeyManager(ADSInterface):
 		return '.'.join(self.ams_net_id.split('.')[:4])
 
 	@staticmethod
+	@lru_cache(maxsize=1)
 	def get_ssh_dir() -> Path:
-		"""Get the .ssh directory path."""
+		"""Get the .ssh directory path (resolved once per process)."""
 		return Path.home() / ".ssh"
 
 	@staticmethod
+	def clear_key_cache() -> None:
+		"""Forget cached .ssh directory and default key lookups."""
+		ADSSSHKeyManager.get_ssh_dir.cache_clear()
+		ADSSSHKeyManager.find_default_key.cache_clear()
+		ADSSSHKeyManager.find_default_public_key.cache_clear()
+
+	@staticmethod
+	@lru_cache(maxsize=1)
 	def find_default_key() -> str | None:
 		"""
 		Find the default SSH private key, preferring ed25519 over rsa.
@@ -64,6 +80,7 @@ class ADSSSHKeyManager(ADSInterface):
 		return None
 
 	@staticmethod
+	@lru_cache(maxsize=1)
 	def find_default_public_key() -> str | None:
 		"""
 		Find the default SSH public key, preferring ed25519 over rsa.
@@ -123,8 +140,31 @@ class ADSSSHKeyManager(ADSInterface):
 		if result.returncode != 0:
 			raise RuntimeError(f"Failed to generate SSH key: {result.stderr}")
 
+		# New key changes the default key lookup results
+		ADSSSHKeyManager.find_default_key.cache_clear()
+		ADSSSHKeyManager.find_default_public_key.cache_clear()
+
 		return str(key_path)
 
+	@staticmethod
+	def _retry_delay(attempt: int) -> float:
+		"""Exponential backoff delay in seconds after a failed attempt (0.5s, 1s, 2s, ...)."""
+		return min(0.25 * 2 ** attempt, 2)
+
+	@staticmethod
+	def _probe_ssh_port(host: str, port: str = "22", timeout: float = 2) -> bool:
+		"""
+		Check that an SSH server answers on host:port without spawning ssh.
+
+		Returns:
+			True if the server sent an SSH identification banner, False otherwise
+		"""
+		try:
+			with socket.create_connection((host, int(port)), timeout=timeout) as sock:
+				return sock.recv(8).startswith(b"SSH-")
+		except (OSError, ValueError):
+			return False
+
 	@staticmethod
 	def test_ssh_connection(host: str, user: str, port: str = "22", key_file: str | None = None, max_retries: int = 1) -> bool:
 		"""
@@ -143,26 +183,26 @@ class ADSSSHKeyManager(ADSInterface):
 		Raises:
 			FileNotFoundError: If SSH client is not installed
 		"""
-		for attempt in range(1, max_retries + 1):
-			try:
-				cmd = [
-					'ssh',
-					'-o', 'BatchMode=yes',
-					'-o', 'ConnectTimeout=5',
-					'-o', 'StrictHostKeyChecking=accept-new',
-					'-p', port,
-				]
+		cmd = [
+			'ssh',
+			'-o', 'BatchMode=yes',
+			'-o', 'ConnectTimeout=5',
+			'-o', 'StrictHostKeyChecking=accept-new',
+			'-p', port,
+		]
 
-				if key_file:
-					cmd.extend(['-i', key_file])
+		if key_file:
+			cmd.extend(['-i', key_file])
 
-				cmd.extend([f'{user}@{host}', 'exit 0'])
+		cmd.extend([f'{user}@{host}', 'exit 0'])
 
+		for attempt in range(1, max_retries + 1):
+			try:
 				result = subprocess.run(
 					cmd,
-					capture_output=True,
-					timeout=10,
-					text=True
+					stdout=subprocess.DEVNULL,
+					stderr=subprocess.DEVNULL,
+					timeout=10
 				)
 
 				if result.returncode == 0:
@@ -175,13 +215,13 @@ class ADSSSHKeyManager(ADSInterface):
 				pass
 
 			if attempt < max_retries:
-				time.sleep(1)
+				time.sleep(ADSSSHKeyManager._retry_delay(attempt))
 
 		return False
 
 	def copy_ssh_key(self, key_path: str | None = None):
 		"""
-		Copy SSH public key to Windows admin authorized_keys if not already present.
+		Append SSH public key to Windows admin authorized_keys if not already present.
 
 		Args:
 			key_path: Local SSH public key path (auto-detects if None)
@@ -191,11 +231,7 @@ class ADSSSHKeyManager(ADSInterface):
 		"""
 		# Auto-detect SSH key
 		if not key_path:
-			for keyname in ["id_ed25519.pub", "id_rsa.pub"]:
-				candidate = self.ssh_dir / keyname
-				if candidate.exists():
-					key_path = str(candidate)
-					break
+			key_path = self.find_default_public_key()
 
 		if not key_path:
 			raise FileNotFoundError(
@@ -206,17 +242,20 @@ class ADSSSHKeyManager(ADSInterface):
 		with open(key_path, 'r') as f:
 			key_content = f.read().strip()
 
-		# Check if key already exists
-		try:
-			existing_content = self.read_file(self.AUTHORIZED_KEYS_PATH)
+		with self:
+			# Read existing keys once; any error means the file will be created
+			try:
+				existing_content = self.read_file(self.AUTHORIZED_KEYS_PATH)
+			except Exception:
+				existing_content = ""
+
 			if self._is_key_present(existing_content, key_content):
 				return
-		except Exception:
-			# File doesn't exist or can't be read - will create it
-			pass
 
-		# Copy key
-		self.write_file(self.AUTHORIZED_KEYS_PATH, key_content + "\n")
+			# Append key to existing content and write it back in a single write
+			if existing_content and not existing_content.endswith("\n"):
+				existing_content += "\n"
+			self.write_file(self.AUTHORIZED_KEYS_PATH, existing_content + key_content + "\n")
 
 	def restart_openssh_server(self, timeout_ms: int = 10000) -> int:
 		"""
@@ -231,16 +270,17 @@ class ADSSSHKeyManager(ADSInterface):
 		Raises:
 			RuntimeError: If PID file not found or PID doesn't change within timeout
 		"""
-		old_pid = self._read_sshd_pid()
-		if old_pid is None:
-			raise RuntimeError("SSH server PID file not found - service may not be running")
+		with self:
+			old_pid = self._read_sshd_pid()
+			if old_pid is None:
+				raise RuntimeError("SSH server PID file not found - service may not be running")
 
-		cmd = 'powershell.exe -Command "Restart-Service sshd"'
-		self.run_command(cmd, timeout_ms=timeout_ms, hide_window=True)
+			cmd = 'powershell.exe -Command "Restart-Service sshd"'
+			self.run_command(cmd, timeout_ms=timeout_ms, hide_window=True)
 
-		# Poll PID file until it changes or timeout expires
-		timeout_s = timeout_ms // 1000
-		self._poll_pid_change(old_pid, timeout_s)
+			# Poll PID file until it changes or timeout expires
+			timeout_s = timeout_ms // 1000
+			self._poll_pid_change(old_pid, timeout_s)
 
 		return 0
 
@@ -258,35 +298,39 @@ class ADSSSHKeyManager(ADSInterface):
 			FileNotFoundError: If SSH client is not installed
 		"""
 
+		cmd = [
+			'ssh',
+			'-o', 'BatchMode=yes',
+			'-o', 'ConnectTimeout=10',
+			'-o', 'StrictHostKeyChecking=no',
+			'-o', 'UserKnownHostsFile=NUL',
+			'-o', 'GlobalKnownHostsFile=NUL',
+			f'{self.username}@{self.ip_address}',
+			'exit 0'
+		]
+
 		for attempt in range(1, max_retries + 1):
-			try:
-				result = subprocess.run(
-					[
-						'ssh',
-						'-o', 'BatchMode=yes',
-						'-o', 'ConnectTimeout=10',
-						'-o', 'StrictHostKeyChecking=no',
-						'-o', 'UserKnownHostsFile=NUL',
-						'-o', 'GlobalKnownHostsFile=NUL',
-						f'{self.username}@{self.ip_address}',
-						'exit 0'
-					],
-					capture_output=True,
-					timeout=3,
-					text=True
-				)
+			# Skip spawning ssh while nothing answers on the SSH port of the raw target IP
+			if self._probe_ssh_port(self.ip_address):
+				try:
+					result = subprocess.run(
+						cmd,
+						stdout=subprocess.DEVNULL,
+						stderr=subprocess.DEVNULL,
+						timeout=3
+					)
 
-				if result.returncode == 0:
-					return True
+					if result.returncode == 0:
+						return True
 
-			except FileNotFoundError:
-				raise FileNotFoundError("SSH client not found. Install OpenSSH client on this machine.")
+				except FileNotFoundError:
+					raise FileNotFoundError("SSH client not found. Install OpenSSH client on this machine.")
 
-			except (subprocess.TimeoutExpired, Exception):
-				pass
+				except (subprocess.TimeoutExpired, Exception):
+					pass
 
 			if attempt < max_retries:
-				time.sleep(1)
+				time.sleep(ADSSSHKeyManager._retry_delay(attempt))
 
 		return False
 
@@ -311,15 +355,9 @@ class ADSSSHKeyManager(ADSInterface):
 		Returns:
 			True if key is already present
 		"""
-		# Normalize both contents (strip whitespace, compare key parts)
-		key_content = key_content.strip()
-
-		# Check each line in authorized_keys
-		for line in authorized_keys_content.splitlines():
-			if line.strip() == key_content:
-				return True
-
-		return False
+		# Normalize both contents (strip whitespace) and look the key up in a set of lines
+		authorized_keys = {line.strip() for line in authorized_keys_content.splitlines()}
+		return key_content.strip() in authorized_keys
 
 	def _read_sshd_pid(self) -> int | None:
 		"""
@@ -339,7 +377,7 @@ class ADSSSHKeyManager(ADSInterface):
 
 	def _poll_pid_change(self, old_pid: int, timeout_s: int) -> int:
 		"""
-		Poll PID file until it changes from old_pid.
+		Poll PID file until it changes from old_pid, backing off exponentially.
 
 		Args:
 			old_pid: Previous PID to compare against
@@ -351,13 +389,18 @@ class ADSSSHKeyManager(ADSInterface):
 		Raises:
 			RuntimeError: If PID doesn't change or file not found within timeout
 		"""
-		for _ in range(timeout_s):
-			time.sleep(1)
+		delay = self.PID_POLL_INITIAL_DELAY
+		waited = 0.0
+		while waited < timeout_s:
+			time.sleep(delay)
+			waited += delay
 			new_pid = self._read_sshd_pid()
 
 			if new_pid is not None and new_pid != old_pid:
 				return new_pid
 
+			delay = min(delay * self.PID_POLL_BACKOFF, self.PID_POLL_MAX_DELAY)
+
 		# Timeout expired, check final state
 		new_pid = self._read_sshd_pid()
 
@@ -1,3 +1,5 @@
+import re
+import shutil
 import subprocess
 import sys
 from pathlib import Path
@@ -10,6 +12,10 @@ MIN_TCPKG_VERSION = "2.3.65"
 class Tcpkg:
 	"""Thin wrapper for TcPkg CLI operations - all static methods"""
 
+	# Process-lifetime caches for TcPkg probes
+	_installed = False
+	_remote_exists_cache: dict[str, bool] = {}
+
 	@staticmethod
 	def _run_command(cmd: List[str], error_msg: str, input_text: Optional[str] = None) -> None:
 		"""Execute command and raise RuntimeError if it fails."""
@@ -19,21 +25,26 @@ class Tcpkg:
 
 	@staticmethod
 	def check_tcpkg_installed() -> None:
-		"""Verify TcPkg is in PATH."""
-		try:
-			subprocess.run(["where", "TcPkg"], check=True, capture_output=True)
-		except (subprocess.CalledProcessError, FileNotFoundError):
+		"""Verify TcPkg is in PATH. Successful result is cached for the process lifetime."""
+		if Tcpkg._installed:
+			return
+		if shutil.which("TcPkg") is None:
 			raise RuntimeError("TcPkg not found. Install TcPkg and add to PATH.")
+		Tcpkg._installed = True
 
 	@staticmethod
 	def check_remote_exists(remote_name: str) -> bool:
-		"""Check if remote target exists by parsing remote list output."""
+		"""Check if remote target exists by parsing remote list output. Results are cached per remote."""
+		if remote_name in Tcpkg._remote_exists_cache:
+			return Tcpkg._remote_exists_cache[remote_name]
 		try:
 			result = subprocess.run(["TcPkg", "remote", "list"], capture_output=True, text=True)
-			return any(line.strip().startswith(f"{remote_name} - Host:")
-					  for line in result.stdout.split('\n'))
+			pattern = rf"^[ \t]*{re.escape(remote_name)} - Host:"
+			exists = re.search(pattern, result.stdout, re.MULTILINE) is not None
 		except subprocess.CalledProcessError:
 			return False
+		Tcpkg._remote_exists_cache[remote_name] = exists
+		return exists
 
 	@staticmethod
 	def run_with_remote(remote_name: str, commands: List[str]) -> None:
@@ -57,11 +68,13 @@ class Tcpkg:
 
 		cmd.extend(["-k", key_file])
 
+		Tcpkg._remote_exists_cache.pop(remote_name, None)
 		Tcpkg._run_command(cmd, f"Failed to add remote target '{remote_name}'")
 
 	@staticmethod
 	def remove_remote(remote_name: str) -> None:
 		"""Remove remote target."""
+		Tcpkg._remote_exists_cache.pop(remote_name, None)
 		Tcpkg._run_command(
 			["TcPkg", "remote", "remove", remote_name],
 			f"Failed to remove remote target '{remote_name}'"
@@ -1,24 +1,91 @@
 """Command-line interface for tcpkgman."""
 
-import argparse
 import os
 import platform
 import sys
-from . import Tcpkg, __version__
-from .ads_ssh_key_manager import ADSSSHKeyManager
-from .ads_interface import ADSInterface
-from .ads_dll import ADSError
-from .utils import Utils, BOLD, CYAN, YELLOW, GREEN, DIM, RESET
+from types import SimpleNamespace
+from typing import TYPE_CHECKING
+from ._version import __version__
+from .utils import prompt, choice, error, check_admin_privileges, getenv, BOLD, CYAN, YELLOW, GREEN, DIM, RESET
+
+if TYPE_CHECKING:
+	import argparse
+
+# SSH init progress messages
+_MSG_SSH_INIT = f"\n{BOLD}Initialize SSH connection via ADS{RESET}\n"
+_MSG_COPYING = f"{CYAN}Copying SSH key...{RESET}\n"
+_MSG_RESTARTING = f"{CYAN}Restarting OpenSSH server...{RESET}\n"
+_MSG_CHECKING = f"{CYAN}Checking SSH connection...{RESET}\n"
+_MSG_SSH_OK = f"{GREEN}SSH connection successful!{RESET}\n"
+_MSG_SSH_FAILED = f"{YELLOW}SSH connection check failed. Verify SSH server is running on target.{RESET}\n"
+
+# Management option values for pass-through invocations, shared by the fast path and the stub parser
+_PASSTHROUGH_DEFAULTS = {"remote_add": None, "remote_remove": None, "remote_list": False, "remote_ssh_init": False}
 
 
 class Tcpkgman:
 	"""CLI for tcpkgman."""
 
+	# Options that need the full parser (remote management and help)
+	MANAGEMENT_OPTION_PREFIXES = ("--remote-", "-h", "--h")
+
+	# Invocations that only print help
+	HELP_ARGVS = ([], ["-h"], ["--help"])
+
 	def __init__(self):
 		if platform.system() != "Windows":
 			raise RuntimeError("tcpkgman only supports Windows for now")
-		
-		self.parser = argparse.ArgumentParser(
+
+		self.parser = None
+
+	@staticmethod
+	def _needs_full_parser(argv: list[str]) -> bool:
+		"""Return True if argv uses management options, help or --remote abbreviations."""
+		for arg in argv:
+			if arg.startswith(Tcpkgman.MANAGEMENT_OPTION_PREFIXES):
+				return True
+			# Abbreviations like --rem may be ambiguous with --remote-*; only the full parser can tell
+			if arg.startswith("--r") and arg != "--remote" and not arg.startswith("--remote="):
+				return True
+		return False
+
+	@staticmethod
+	def _fast_parse(argv: list[str]) -> tuple[SimpleNamespace, list[str]] | None:
+		"""
+		Parse pass-through argv (--remote plus TcPkg arguments) without argparse.
+
+		Returns:
+			(args, remaining) like parse_known_args, or None if argv needs argparse
+			(missing --remote value, abbreviated options, or "--")
+		"""
+		remote = None
+		remaining = []
+		i = 0
+		while i < len(argv):
+			arg = argv[i]
+			if arg == "--remote":
+				if i + 1 >= len(argv) or argv[i + 1].startswith("-"):
+					return None
+				remote = argv[i + 1]
+				i += 2
+				continue
+			if arg.startswith("--remote="):
+				remote = arg[len("--remote="):]
+			elif arg == "--" or arg.startswith("--r"):
+				return None
+			else:
+				remaining.append(arg)
+			i += 1
+
+		args = SimpleNamespace(remote=remote, **_PASSTHROUGH_DEFAULTS)
+		return args, remaining
+
+	def _build_parser(self, full: bool = True) -> "argparse.ArgumentParser":
+		"""Build argument parser. Pass-through parser only knows --remote."""
+		# Deferred so fast-parsed pass-through invocations never import argparse
+		import argparse
+
+		parser = argparse.ArgumentParser(
 			prog="tcpkgman",
 			description=f"tcpkgman v{__version__} - TwinCAT Package Manager Helper",
 			epilog="""Examples:
@@ -31,44 +98,52 @@ class Tcpkgman:
 			formatter_class=argparse.RawDescriptionHelpFormatter,
 		)
 
-		self.parser.add_argument(
+		parser.add_argument(
 			"--remote",
 			metavar="<name>",
 			help="Remote target (or use TCPKG_REMOTE env var)",
 		)
-		self.parser.add_argument(
+
+		if not full:
+			parser.set_defaults(**_PASSTHROUGH_DEFAULTS)
+			return parser
+
+		parser.add_argument(
 			"--remote-add",
 			metavar="<name>",
 			nargs="?",
 			const="",
 			help="Add remote target interactively",
 		)
-		self.parser.add_argument(
+		parser.add_argument(
 			"--remote-remove",
 			metavar="<name>",
 			help="Remove remote target",
 		)
-		self.parser.add_argument(
+		parser.add_argument(
 			"--remote-list",
 			action="store_true",
 			help="List all configured remote targets",
 		)
-		self.parser.add_argument(
+		parser.add_argument(
 			"--remote-ssh-init",
 			action="store_true",
 			help="Initialize SSH connection to target via ADS",
 		)
+		return parser
 
 	def _collect_remote_parameters(self, remote_name: str | None = None) -> dict:
 		"""Collect remote configuration parameters from user."""
+		from .ads_ssh_key_manager import ADSSSHKeyManager
+
 		print(f"\n{BOLD}Configure remote target:{RESET}")
 
-		host = Utils.prompt(f"{CYAN}Host address or IP{RESET}", remote_name, False)
-		user = Utils.prompt(f"{CYAN}User{RESET}", "Administrator", True)
-		port = Utils.prompt(f"{CYAN}SSH Port{RESET}", "22", False)
+		host = prompt(f"{CYAN}Host address or IP{RESET}", remote_name, False)
+		user = prompt(f"{CYAN}User{RESET}", "Administrator", True)
+		port = prompt(f"{CYAN}SSH Port{RESET}", "22", False)
 
 		# Internet access
-		internet_choice = Utils.choice(
+		internet_choice = choice(
 			"Does the remote target have internet access?\n"
 			"(If no, packages will be copied from this machine to the target)",
 			["no (copy packages from here)", "yes (download directly on target)"],
@@ -80,7 +155,7 @@ class Tcpkgman:
 		default_key = ADSSSHKeyManager.find_default_key()
 		if default_key is None:
 			ssh_dir = ADSSSHKeyManager.get_ssh_dir()
-			generate_choice = Utils.choice(
+			generate_choice = choice(
 				f"No SSH key found in {ssh_dir}. Would you like to generate SSH public key (ed25519)?",
 				["yes", "no (provide custom path)"],
 				default_index=0
@@ -88,7 +163,7 @@ class Tcpkgman:
 			if generate_choice == "yes":
 				default_key = ADSSSHKeyManager.generate_key("ed25519")
 
-		key_file = Utils.prompt("Path to private key file", default_key, True)
+		key_file = prompt("Path to private key file", default_key, True)
 
 		return {
 			"host": host,
@@ -101,15 +176,31 @@ class Tcpkgman:
 	def run(self):
 		"""Run CLI."""
 		try:
-			args, remaining = self.parser.parse_known_args()
+			argv = sys.argv[1:]
+
+			# Print help directly without parsing
+			if argv in self.HELP_ARGVS:
+				self.parser = self._build_parser()
+				self.parser.print_help()
+				sys.exit(0)
+
+			full = self._needs_full_parser(argv)
+			parsed = None if full else self._fast_parse(argv)
+			if parsed is None:
+				self.parser = self._build_parser(full)
+				args, remaining = self.parser.parse_known_args(argv)
+			else:
+				args, remaining = parsed
 
 			# Check for TCPKG_REMOTE environment variable if --remote not provided
 			if not args.remote:
-				args.remote = os.environ.get('TCPKG_REMOTE')
+				args.remote = getenv('TCPKG_REMOTE')
 
 			# Check if any operation requires TcPkg
-			needs_tcpkg = args.remote_add or args.remote_remove or args.remote_list or remaining
+			needs_tcpkg = args.remote_add is not None or args.remote_remove or args.remote_list or remaining
 			if needs_tcpkg:
+				# Deferred so help and SSH init paths skip loading the TcPkg wrapper
+				from .tcpkg import Tcpkg
 				Tcpkg.check_tcpkg_installed()
 
 			# Handle remote-ssh-init
@@ -120,7 +211,7 @@ class Tcpkgman:
 			# Handle remote-add
 			if args.remote_add is not None:
 				# Prompt for name if not provided
-				remote_name = args.remote_add if args.remote_add else Utils.prompt(f"{CYAN}Remote name{RESET}", None, True)
+				remote_name = args.remote_add if args.remote_add else prompt(f"{CYAN}Remote name{RESET}", None, True)
 
 				if Tcpkg.check_remote_exists(remote_name):
 					print(f"Remote '{remote_name}' already exists")
@@ -130,7 +221,7 @@ class Tcpkgman:
 
 			# Handle remote-remove
 			if args.remote_remove:
-				Utils.check_admin_privileges()
+				check_admin_privileges()
 				Tcpkg.remove_remote(args.remote_remove)
 				return
 
@@ -141,11 +232,13 @@ class Tcpkgman:
 
 			# Handle other commands
 			if not remaining:
+				if not full:
+					self.parser = self._build_parser()
 				self.parser.print_help()
 				sys.exit(0)
 
 			if not args.remote:
-				Utils.error("--remote or TCPKG_REMOTE required")
+				error("--remote or TCPKG_REMOTE required")
 
 			if not Tcpkg.check_remote_exists(args.remote):
 				self._add_remote_interactive(args.remote)
@@ -155,10 +248,11 @@ class Tcpkgman:
 			print("\nCancelled", file=sys.stderr)
 			sys.exit(130)
 		except Exception as e:
-			Utils.error(str(e))
+			error(str(e))
 
 	def _add_remote_interactive(self, remote_name: str, skip_confirmation: bool = False) -> None:
 		"""Add remote target interactively."""
+		from .tcpkg import Tcpkg
 
 		if not skip_confirmation:
 			response = input(
@@ -168,7 +262,7 @@ class Tcpkgman:
 			if response.lower() != "y":
 				raise RuntimeError("Remote target not configured.")
 
-		Utils.check_admin_privileges()
+		check_admin_privileges()
 
 		params = self._collect_remote_parameters(remote_name)
 
@@ -190,10 +284,10 @@ class Tcpkgman:
 
 	def _check_ssh_setup(self, host: str, user: str, port: str, key_file: str) -> bool:
 		"""Check if SSH key exists and connection works. Returns True if setup is good."""
-		from pathlib import Path
+		from .ads_ssh_key_manager import ADSSSHKeyManager
 
 		# Check if key file exists
-		if not Path(key_file).exists():
+		if not os.path.exists(key_file):
 			print(f"\n{YELLOW}SSH key not found: {key_file}{RESET}")
 			return False
 
@@ -214,11 +308,14 @@ class Tcpkgman:
 		return response.lower() == "y"
 
 	def _ssh_init_interactive(self) -> None:
-		print(f"\n{BOLD}Initialize SSH connection via ADS{RESET}")
+		from .ads_dll import ADSError, get_ads_dll
+		from .ads_interface import ADSInterface
+		from .ads_ssh_key_manager import ADSSSHKeyManager
+
+		sys.stdout.write(_MSG_SSH_INIT)
 
 		# Check if TwinCAT Router is installed by loading DLL
 		try:
-			from .ads_dll import get_ads_dll
 			get_ads_dll()
 		except FileNotFoundError as e:
 			raise RuntimeError(
@@ -229,27 +326,24 @@ class Tcpkgman:
 		# Try to read TwinCAT targets
 		targets = ADSInterface.get_twincat_targets()
 
-		# Build choices list with mapping (targets + manual entry)
-		choices = []
-		choice_to_netid = {}
-		for name, (net_id, ip_addr) in targets.items():
-			display = f"{name} (IP: {ip_addr}, Net ID: {net_id})"
-			choices.append(display)
-			choice_to_netid[display] = net_id
-		choices.append("Manual entry")
+		# Menu labels and NetIDs share the target order; manual entry is the last choice
+		labels = [f"{name} (IP: {ip_addr}, Net ID: {net_id})" for name, (net_id, ip_addr) in targets.items()]
+		net_ids = [net_id for net_id, _ in targets.values()]
+		labels.append("Manual entry")
 
-		choice = Utils.choice(
+		index = choice(
 			"Select target:",
-			choices,
-			default_index=0
+			labels,
+			default_index=0,
+			return_index=True
 		)
 
-		if choice == "Manual entry":
-			ams_net_id = Utils.prompt(f"{CYAN}Target AMS NetID{RESET}", None, True)
+		if index < len(net_ids):
+			ams_net_id = net_ids[index]
 		else:
-			ams_net_id = choice_to_netid[choice]
+			ams_net_id = prompt(f"{CYAN}Target AMS NetID{RESET}", None, True)
 
-		username = Utils.prompt(f"{CYAN}Username{RESET}", "Administrator", False)
+		username = prompt(f"{CYAN}Username{RESET}", "Administrator", False)
 
 		try:
 			manager = ADSSSHKeyManager(ams_net_id, username)
@@ -262,7 +356,7 @@ class Tcpkgman:
 			key_generated = False
 			if not key_path:
 				ssh_dir = ADSSSHKeyManager.get_ssh_dir()
-				generate_choice = Utils.choice(
+				generate_choice = choice(
 					f"No SSH key found in {ssh_dir}. Would you like to generate SSH public key (ed25519)?",
 					["yes", "no"],
 					default_index=1
@@ -285,17 +379,17 @@ class Tcpkgman:
 				print("Cancelled")
 				return
 
-			print(f"{CYAN}Copying SSH key...{RESET}")
+			sys.stdout.write(_MSG_COPYING)
 			manager.copy_ssh_key(key_path)
 
-			print(f"{CYAN}Restarting OpenSSH server...{RESET}")
+			sys.stdout.write(_MSG_RESTARTING)
 			manager.restart_openssh_server()
 
-			print(f"{CYAN}Checking SSH connection...{RESET}")
+			sys.stdout.write(_MSG_CHECKING)
 			if manager.check_ssh_connection():
-				print(f"{GREEN}SSH connection successful!{RESET}")
+				sys.stdout.write(_MSG_SSH_OK)
 			else:
-				print(f"{YELLOW}SSH connection check failed. Verify SSH server is running on target.{RESET}")
+				sys.stdout.write(_MSG_SSH_FAILED)
 
 		except ADSError as e:
 			if e.code == 0x7:
@@ -1,7 +1,8 @@
 """Utility functions and constants for tcpkgman."""
 
-import ctypes
+import os
 import sys
+from functools import lru_cache
 from typing import List, NoReturn
 
 # ANSI color codes
@@ -12,49 +13,76 @@ GREEN = "\033[32m"
 DIM = "\033[2m"
 RESET = "\033[0m"
 
+# Choice menu markers
+MARK_DEFAULT = f"{GREEN}*{RESET}"
+MARK_OTHER = " "
+
+# Cached administrator check result (cannot change during a run)
+_IS_ADMIN = None
+
+
+@lru_cache(maxsize=None)
+def getenv(name: str) -> str | None:
+	"""Get environment variable. Cached, as the environment does not change during a run."""
+	return os.environ.get(name)
+
+
+def check_admin_privileges() -> None:
+	"""Check if running with administrator privileges."""
+	global _IS_ADMIN
+	if _IS_ADMIN is None:
+		import ctypes
+		_IS_ADMIN = bool(ctypes.windll.shell32.IsUserAnAdmin())
+	if not _IS_ADMIN:
+		raise RuntimeError("Requires administrator privileges. Run as Administrator.")
+
+
+def prompt(field: str, default: str | None, required: bool) -> str:
+	"""Prompt for input with optional default."""
+	prompt_text = f"{field} [{default}]: " if default else f"{field}: "
+	value = input(prompt_text).strip() or default or ""
+	if required and not value:
+		raise ValueError(f"{field} is required")
+	return value
+
+
+def choice(prompt: str, choices: List[str], default_index: int = 0, return_index: bool = False) -> str | int:
+	"""Display a numbered choice menu and return the selected option (or its index if return_index)."""
+	# Write the whole menu at once
+	lines = [f"\n{CYAN}{prompt}{RESET}"]
+	for i, option in enumerate(choices, 1):
+		marker = MARK_DEFAULT if i - 1 == default_index else MARK_OTHER
+		lines.append(f"  {marker} {DIM}{i}.{RESET} {option}")
+	sys.stdout.write("\n".join(lines) + "\n")
+
+	select_prompt = f"\n{DIM}Select [1-{len(choices)}] (default: {default_index + 1}):{RESET} "
+	range_error = f"Please enter a number between 1 and {len(choices)}"
+	while True:
+		choice_input = input(select_prompt).strip()
+		if not choice_input:
+			return default_index if return_index else choices[default_index]
+
+		# Reject non-numeric input up front instead of catching ValueError from int()
+		if not choice_input.isdecimal():
+			print("Please enter a valid number")
+			continue
+
+		index = int(choice_input) - 1
+		if 0 <= index < len(choices):
+			return index if return_index else choices[index]
+		print(range_error)
+
+
+def error(msg: str) -> NoReturn:
+	"""Print error and exit."""
+	print(f"Error: {msg}", file=sys.stderr)
+	sys.exit(1)
+
 
 class Utils:
-	"""Utility class for tcpkgman."""
-
-	@staticmethod
-	def check_admin_privileges() -> None:
-		"""Check if running with administrator privileges."""
-		if not ctypes.windll.shell32.IsUserAnAdmin():
-			raise RuntimeError("Requires administrator privileges. Run as Administrator.")
-
-	@staticmethod
-	def prompt(field: str, default: str | None, required: bool) -> str:
-		"""Prompt for input with optional default."""
-		prompt_text = f"{field} [{default}]: " if default else f"{field}: "
-		value = input(prompt_text).strip() or default or ""
-		if required and not value:
-			raise ValueError(f"{field} is required")
-		return value
-
-	@staticmethod
-	def choice(prompt: str, choices: List[str], default_index: int = 0) -> str:
-		"""Display a numbered choice menu and return the selected option."""
-		print(f"\n{CYAN}{prompt}{RESET}")
-		for i, choice in enumerate(choices, 1):
-			marker = f"{GREEN}*{RESET}" if i - 1 == default_index else " "
-			print(f"  {marker} {DIM}{i}.{RESET} {choice}")
-
-		while True:
-			try:
-				choice_input = input(f"\n{DIM}Select [1-{len(choices)}] (default: {default_index + 1}):{RESET} ").strip()
-				if not choice_input:
-					return choices[default_index]
-
-				index = int(choice_input) - 1
-				if 0 <= index < len(choices):
-					return choices[index]
-				else:
-					print(f"Please enter a number between 1 and {len(choices)}")
-			except ValueError:
-				print(f"Please enter a valid number")
-
-	@staticmethod
-	def error(msg: str) -> NoReturn:
-		"""Print error and exit."""
-		print(f"Error: {msg}", file=sys.stderr)
-		sys.exit(1)
+	"""Utility class for tcpkgman. Kept for API compatibility; wraps the module-level functions."""
+
+	check_admin_privileges = staticmethod(check_admin_privileges)
+	prompt = staticmethod(prompt)
+	choice = staticmethod(choice)
+	error = staticmethod(error)
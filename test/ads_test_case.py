@@ -0,0 +1,27 @@
+"""Shared test case for tests that mock the TwinCAT ADS DLL."""
+
+import unittest
+from unittest.mock import patch, MagicMock
+from tcpkgman.ads_dll import TcAdsDll
+
+
+class ADSTestCase(unittest.TestCase):
+	"""Test case sharing one spec'd TcAdsDll mock per test class."""
+
+	# Port returned by the mocked port_open
+	PORT = 12345
+
+	@classmethod
+	def setUpClass(cls):
+		"""Create DLL mock shared by all tests in this class."""
+		super().setUpClass()
+		cls.mock_dll = MagicMock(spec=TcAdsDll)
+
+	def setUp(self):
+		"""Reset the shared DLL mock and return it from get_ads_dll."""
+		super().setUp()
+		self.mock_dll.reset_mock(return_value=True, side_effect=True)
+		self.mock_dll.port_open.return_value = self.PORT
+		patcher = patch('tcpkgman.ads_interface.get_ads_dll', return_value=self.mock_dll)
+		patcher.start()
+		self.addCleanup(patcher.stop)
@@ -0,0 +1,38 @@
+"""Tests for TcAdsDll ctypes structures."""
+
+import unittest
+from tcpkgman.ads_dll import AmsNetId, AmsAddr
+
+
+class TestAmsNetId(unittest.TestCase):
+	"""Test AmsNetId.from_string method."""
+
+	def test_parses_valid_net_id(self):
+		"""Test valid NetID is parsed into six octets."""
+		addr = AmsNetId.from_string("192.168.1.100.1.1")
+		self.assertEqual(bytes(addr.b), bytes([192, 168, 1, 100, 1, 1]))
+
+	def test_ignores_surrounding_whitespace(self):
+		"""Test NetID padded with whitespace (e.g. from StaticRoutes.xml) is accepted."""
+		addr = AmsNetId.from_string(" 192.168.1.100.1.1\n")
+		self.assertEqual(bytes(addr.b), bytes([192, 168, 1, 100, 1, 1]))
+
+	def test_rejects_invalid_net_id(self):
+		"""Test malformed NetIDs raise ValueError."""
+		for net_id in [
+			"192.168.1.100", "192.168.1.100.1.1.1", "192.168.1.x.1.1", "192.168.1.256.1.1", "",
+			"\u0661.2.3.4.5.6", "192. 168.1.100.1.1",
+		]:
+			with self.subTest(net_id=net_id):
+				with self.assertRaises(ValueError):
+					AmsNetId.from_string(net_id)
+
+	def test_ams_addr_sets_net_id_and_port(self):
+		"""Test AmsAddr stores parsed NetID and port."""
+		addr = AmsAddr("5.80.201.232.1.1", 851)
+		self.assertEqual(bytes(addr.netId.b), bytes([5, 80, 201, 232, 1, 1]))
+		self.assertEqual(addr.port, 851)
+
+
+if __name__ == '__main__':
+	unittest.main()
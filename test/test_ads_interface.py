@@ -1,27 +1,31 @@
 """Tests for ADS interface."""
 
+import os
 import unittest
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch
 import struct
-from tcpkgman.ads_interface import ADSInterface, SYSTEMSERVICE_STARTPROCESS
-
-class TestADSInterfaceRunCommand(unittest.TestCase):
+import tempfile
+from pathlib import Path
+from tcpkgman import ads_interface
+from tcpkgman.ads_interface import ADSInterface, SYSTEMSERVICE_FREAD, SYSTEMSERVICE_STARTPROCESS
+from tcpkgman import utils
+try:
+	from .ads_test_case import ADSTestCase
+except ImportError:
+	# Test file run directly as a script rather than as part of the test package
+	from ads_test_case import ADSTestCase
+
+
+class TestADSInterfaceRunCommand(ADSTestCase):
 	"""Test ADSInterface.run_command method."""
 
-	@patch('tcpkgman.ads_interface.get_ads_dll')
-	def setUp(self, mock_get_dll):
+	def setUp(self):
 		"""Create test instance."""
-		# Mock DLL loading
-		mock_get_dll.return_value = MagicMock()
+		super().setUp()
 		self.ads = ADSInterface("192.168.100.117.1.1")
 
 	def test_run_command_returns_immediately(self):
 		"""Test run_command returns immediately (ADS call doesn't block)."""
-		# Mock the DLL methods on self.ads._dll
-		self.ads._dll.port_open = MagicMock(return_value=12345)
-		self.ads._dll.port_close = MagicMock()
-		self.ads._dll.write = MagicMock()
-
 		# Execute command
 		exit_code = self.ads.run_command(
 			"cmd.exe /c exit 123",
@@ -39,11 +43,6 @@ class TestADSInterfaceRunCommand(unittest.TestCase):
 
 	def test_run_command_with_default_timeout(self):
 		"""Test run_command uses default 5000ms timeout."""
-		# Mock the DLL methods on self.ads._dll
-		self.ads._dll.port_open = MagicMock(return_value=12345)
-		self.ads._dll.port_close = MagicMock()
-		self.ads._dll.write = MagicMock()
-
 		# Execute command without specifying timeout (should use default)
 		exit_code = self.ads.run_command("cmd.exe /c dir")
 
@@ -56,12 +55,6 @@ class TestADSInterfaceRunCommand(unittest.TestCase):
 
 	def test_run_command_builds_correct_structure(self):
 		"""Test run_command builds correct STARTPROCESS structure."""
-		# Mock the DLL methods on self.ads._dll
-		mock_port = 12345
-		self.ads._dll.port_open = MagicMock(return_value=mock_port)
-		self.ads._dll.port_close = MagicMock()
-		self.ads._dll.write = MagicMock()
-
 		# Execute command
 		self.ads.run_command(
 			"powershell.exe -Command Get-Service",
@@ -75,7 +68,7 @@ class TestADSInterfaceRunCommand(unittest.TestCase):
 		call_args = self.ads._dll.write.call_args[0]
 
 		# Verify arguments (port, addr, index_group, index_offset, data)
-		self.assertEqual(call_args[0], mock_port)
+		self.assertEqual(call_args[0], self.PORT)
 		self.assertEqual(call_args[2], SYSTEMSERVICE_STARTPROCESS)
 
 		# Verify index_offset has timeout and SW_HIDE flag
@@ -105,11 +98,6 @@ class TestADSInterfaceRunCommand(unittest.TestCase):
 
 	def test_run_command_without_hide_window(self):
 		"""Test run_command without SW_HIDE flag."""
-		# Mock the DLL methods on self.ads._dll
-		self.ads._dll.port_open = MagicMock(return_value=12345)
-		self.ads._dll.port_close = MagicMock()
-		self.ads._dll.write = MagicMock()
-
 		# Execute command with hide_window=False
 		self.ads.run_command(
 			"cmd.exe /c dir",
@@ -126,9 +114,43 @@ class TestADSInterfaceRunCommand(unittest.TestCase):
 		self.assertEqual(call_args[3], expected_offset)
 
 
+# Route fields used by StaticRoutes.xml tests
+PLC1_ROUTE = {"Name": "PLC1", "NetId": "192.168.1.10.1.1", "Address": "192.168.1.10"}
+PLC2_ROUTE = {"Name": "PLC2", "NetId": "192.168.1.20.1.1", "Address": "192.168.1.20"}
+
+
+def route_xml(fields: dict) -> str:
+	"""Build a Route element from field name/value pairs."""
+	children = "".join(f"<{tag}>{value}</{tag}>" for tag, value in fields.items())
+	return f"<Route>{children}</Route>"
+
+
+def write_routes(path: Path, routes_xml: str):
+	"""Write StaticRoutes.xml with given Route entries."""
+	path.write_text(
+		'<?xml version="1.0" encoding="utf-8"?>\n'
+		f"<TcConfig><RemoteConnections>{routes_xml}</RemoteConnections></TcConfig>"
+	)
+
+
 class TestGetTwincatTargets(unittest.TestCase):
 	"""Test ADSInterface.get_twincat_targets method."""
 
+	def setUp(self):
+		"""Create temporary TwinCAT directory."""
+		utils.getenv.cache_clear()
+		ads_interface._parse_routes.cache_clear()
+		self.tmp_dir = tempfile.TemporaryDirectory()
+		self.twincat_dir = Path(self.tmp_dir.name)
+		self.routes_path = self.twincat_dir / "Target" / "StaticRoutes.xml"
+		self.routes_path.parent.mkdir()
+
+	def tearDown(self):
+		"""Remove temporary TwinCAT directory."""
+		self.tmp_dir.cleanup()
+		utils.getenv.cache_clear()
+		ads_interface._parse_routes.cache_clear()
+
 	@patch.dict('os.environ', {}, clear=True)
 	def test_no_twincat3dir_env_var(self):
 		"""Test returns empty dict when TWINCAT3DIR not set."""
@@ -141,142 +163,207 @@ class TestGetTwincatTargets(unittest.TestCase):
 		targets = ADSInterface.get_twincat_targets()
 		self.assertEqual(targets, {})
 
-	@patch.dict('os.environ', {'TWINCAT3DIR': 'C:/TwinCAT/3.1'})
-	@patch('pathlib.Path.exists')
-	@patch('xml.etree.ElementTree.parse')
-	def test_parses_valid_routes(self, mock_parse, mock_exists):
-		"""Test parses valid StaticRoutes.xml correctly."""
-		mock_exists.return_value = True
-
-		# Create mock XML structure
-		mock_tree = MagicMock()
-		mock_root = MagicMock()
-		mock_tree.getroot.return_value = mock_root
-
-		# Create mock routes
-		route1 = MagicMock()
-		route1.findtext.side_effect = lambda x: {
-			"Name": "PLC1",
-			"NetId": "192.168.1.10.1.1",
-			"Address": "192.168.1.10"
-		}.get(x)
-
-		route2 = MagicMock()
-		route2.findtext.side_effect = lambda x: {
-			"Name": "PLC2",
-			"NetId": "192.168.1.20.1.1",
-			"Address": "192.168.1.20"
-		}.get(x)
-
-		mock_root.findall.return_value = [route1, route2]
-		mock_parse.return_value = mock_tree
+	def test_handles_malformed_xml(self):
+		"""Test handles malformed XML gracefully."""
+		self.routes_path.write_text("<TcConfig><Route>")
 
-		targets = ADSInterface.get_twincat_targets()
+		with patch.dict('os.environ', {'TWINCAT3DIR': str(self.twincat_dir)}):
+			targets = ADSInterface.get_twincat_targets()
 
-		self.assertEqual(len(targets), 2)
-		self.assertEqual(targets["PLC1"], ("192.168.1.10.1.1", "192.168.1.10"))
-		self.assertEqual(targets["PLC2"], ("192.168.1.20.1.1", "192.168.1.20"))
+		self.assertEqual(targets, {})
 
-	@patch.dict('os.environ', {'TWINCAT3DIR': 'C:/TwinCAT/3.1'})
-	@patch('pathlib.Path.exists')
-	@patch('xml.etree.ElementTree.parse')
-	def test_handles_malformed_xml(self, mock_parse, mock_exists):
-		"""Test handles malformed XML gracefully."""
-		mock_exists.return_value = True
-		mock_parse.side_effect = Exception("Parse error")
+	@patch.object(ads_interface, '_read_routes', wraps=ads_interface._read_routes)
+	def test_caches_until_file_changes(self, mock_read_routes):
+		"""Test StaticRoutes.xml is re-parsed only when its mtime changes."""
+		write_routes(self.routes_path, route_xml(PLC1_ROUTE))
+
+		with patch.dict('os.environ', {'TWINCAT3DIR': str(self.twincat_dir)}):
+			ADSInterface.get_twincat_targets()
+			ADSInterface.get_twincat_targets()
+			self.assertEqual(mock_read_routes.call_count, 1)
+
+			write_routes(self.routes_path, route_xml(PLC2_ROUTE))
+			stat = self.routes_path.stat()
+			os.utime(self.routes_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+			targets = ADSInterface.get_twincat_targets()
+
+		self.assertEqual(mock_read_routes.call_count, 2)
+		self.assertEqual(targets, {"PLC2": ("192.168.1.20.1.1", "192.168.1.20")})
+
+
+class RouteReaderCases:
+	"""StaticRoutes.xml cases shared by the lxml and expat route readers."""
+
+	# Reader under test, set by subclasses
+	read_routes = None
+
+	def setUp(self):
+		"""Create temporary directory for StaticRoutes.xml."""
+		self.tmp_dir = tempfile.TemporaryDirectory()
+		self.routes_path = Path(self.tmp_dir.name) / "StaticRoutes.xml"
+
+	def tearDown(self):
+		"""Remove temporary directory."""
+		self.tmp_dir.cleanup()
+
+	def read(self, routes_xml: str) -> dict:
+		"""Write given Route entries to StaticRoutes.xml and read them back."""
+		write_routes(self.routes_path, routes_xml)
+		return self.read_routes(str(self.routes_path))
+
+	def test_valid_routes(self):
+		"""Test valid routes are read."""
+		routes = self.read(route_xml(PLC1_ROUTE) + route_xml(PLC2_ROUTE))
+
+		self.assertEqual(routes, {
+			"PLC1": ("192.168.1.10.1.1", "192.168.1.10"),
+			"PLC2": ("192.168.1.20.1.1", "192.168.1.20"),
+		})
+
+	def test_missing_fields(self):
+		"""Test routes with missing or empty fields are skipped."""
+		routes = self.read(
+			route_xml({"Name": "PLC1", "Address": "192.168.1.10"})
+			+ route_xml({"NetId": "192.168.1.20.1.1", "Address": "192.168.1.20"})
+			+ route_xml({"Name": "PLC3", "NetId": "192.168.1.30.1.1", "Address": ""})
+			+ route_xml({"Name": "PLC4", "NetId": "192.168.1.40.1.1", "Address": "192.168.1.40"})
+		)
 
-		targets = ADSInterface.get_twincat_targets()
-		self.assertEqual(targets, {})
+		self.assertEqual(routes, {"PLC4": ("192.168.1.40.1.1", "192.168.1.40")})
 
-	@patch.dict('os.environ', {'TWINCAT3DIR': 'C:/TwinCAT/3.1'})
-	@patch('pathlib.Path.exists')
-	@patch('xml.etree.ElementTree.parse')
-	def test_skips_routes_missing_fields(self, mock_parse, mock_exists):
-		"""Test skips routes with missing Name, NetId, or Address."""
-		mock_exists.return_value = True
-
-		# Create mock XML structure
-		mock_tree = MagicMock()
-		mock_root = MagicMock()
-		mock_tree.getroot.return_value = mock_root
-
-		# Route with missing NetId
-		route1 = MagicMock()
-		route1.findtext.side_effect = lambda x: {
-			"Name": "PLC1",
-			"NetId": None,
-			"Address": "192.168.1.10"
-		}.get(x)
-
-		# Route with missing Name
-		route2 = MagicMock()
-		route2.findtext.side_effect = lambda x: {
-			"Name": None,
-			"NetId": "192.168.1.20.1.1",
-			"Address": "192.168.1.20"
-		}.get(x)
-
-		# Route with missing Address
-		route3 = MagicMock()
-		route3.findtext.side_effect = lambda x: {
-			"Name": "PLC3",
-			"NetId": "192.168.1.30.1.1",
-			"Address": None
-		}.get(x)
-
-		# Valid route
-		route4 = MagicMock()
-		route4.findtext.side_effect = lambda x: {
-			"Name": "PLC4",
-			"NetId": "192.168.1.40.1.1",
-			"Address": "192.168.1.40"
-		}.get(x)
-
-		mock_root.findall.return_value = [route1, route2, route3, route4]
-		mock_parse.return_value = mock_tree
+	def test_net_id_whitespace_stripped(self):
+		"""Test whitespace around NetId text is stripped."""
+		routes = self.read("<Route><Name>PLC1</Name><NetId>\n  192.168.1.10.1.1\n</NetId><Address>192.168.1.10</Address></Route>")
 
-		targets = ADSInterface.get_twincat_targets()
+		self.assertEqual(routes, {"PLC1": ("192.168.1.10.1.1", "192.168.1.10")})
+
+	def test_nested_and_foreign_elements(self):
+		"""Test only direct Name/NetId/Address children of Route are used."""
+		routes = self.read(
+			"<Other><Name>NotARoute</Name></Other>"
+			"<Route><Flags><Name>Nested</Name></Flags>"
+			"<Name>PLC1</Name><Address>192.168.1.10</Address><NetId>192.168.1.10.1.1</NetId></Route>"
+			"<Route><Name>PLC2</Name><Extra><NetId>1.2.3.4.5.6</NetId></Extra><Address>192.168.1.20</Address></Route>"
+		)
+
+		self.assertEqual(routes, {"PLC1": ("192.168.1.10.1.1", "192.168.1.10")})
+
+
+class TestReadRoutesExpat(RouteReaderCases, unittest.TestCase):
+	"""Test the expat StaticRoutes.xml reader."""
+
+	read_routes = staticmethod(ads_interface._read_routes_expat)
+
+
+@unittest.skipUnless(ads_interface.etree is not None, "lxml not installed")
+class TestReadRoutesLxml(RouteReaderCases, unittest.TestCase):
+	"""Test the lxml StaticRoutes.xml reader."""
+
+	read_routes = staticmethod(ads_interface._read_routes_lxml)
 
-		self.assertEqual(len(targets), 1)
-		self.assertEqual(targets["PLC4"], ("192.168.1.40.1.1", "192.168.1.40"))
 
+class TestReadFile(ADSTestCase):
+	"""Test ADSInterface.read_file method."""
 
-class TestCheckConnection(unittest.TestCase):
+	def setUp(self):
+		"""Create test instance."""
+		super().setUp()
+		self.ads = ADSInterface("192.168.100.117.1.1")
+
+	def read_sizes(self):
+		"""Return requested read lengths of all FREAD calls."""
+		return [c[0][4] for c in self.ads._dll.read_write.call_args_list if c[0][2] == SYSTEMSERVICE_FREAD]
+
+	def test_small_file_single_read(self):
+		"""Test small file is read with one initial-size chunk."""
+		self.mock_dll.read_write.side_effect = [struct.pack('<I', 7), b"1234\n"]
+
+		content = self.ads.read_file("C:/ProgramData/ssh/sshd.pid")
+
+		self.assertEqual(content, "1234\n")
+		self.assertEqual(self.read_sizes(), [4096])
+
+	def test_large_file_grows_chunks(self):
+		"""Test read size doubles while chunks come back full."""
+		self.mock_dll.read_write.side_effect = [
+			struct.pack('<I', 7), b"a" * 4, b"b" * 8, b"c" * 3
+		]
+
+		content = self.ads.read_file("C:/file.txt", initial_chunk=4)
+
+		self.assertEqual(content, "a" * 4 + "b" * 8 + "c" * 3)
+		self.assertEqual(self.read_sizes(), [4, 8, 16])
+
+	def test_stops_at_max_size(self):
+		"""Test reading stops once max_size bytes were read."""
+		self.mock_dll.read_write.side_effect = [
+			struct.pack('<I', 7), b"a" * 4, b"b" * 6
+		]
+
+		content = self.ads.read_file("C:/file.txt", max_size=10, initial_chunk=4)
+
+		self.assertEqual(content, "a" * 4 + "b" * 6)
+		self.assertEqual(self.read_sizes(), [4, 6])
+
+
+class TestPortSession(ADSTestCase):
+	"""Test ADSInterface port reuse within a session."""
+
+	def setUp(self):
+		"""Create test instance."""
+		super().setUp()
+		self.ads = ADSInterface("192.168.100.117.1.1")
+
+	def test_session_reuses_single_port(self):
+		"""Test operations inside a session share one ADS port."""
+		with self.ads:
+			self.ads.run_command("cmd.exe /c dir")
+			self.ads.run_command("cmd.exe /c dir")
+			self.ads._dll.port_close.assert_not_called()
+
+		self.ads._dll.port_open.assert_called_once()
+		self.ads._dll.port_close.assert_called_once_with(self.PORT)
+		for call in self.ads._dll.write.call_args_list:
+			self.assertEqual(call[0][0], self.PORT)
+
+	def test_nested_session_closes_port_once(self):
+		"""Test nested sessions keep the port open until the outermost exits."""
+		with self.ads:
+			with self.ads:
+				self.ads.run_command("cmd.exe /c dir")
+			self.ads._dll.port_close.assert_not_called()
+
+		self.ads._dll.port_open.assert_called_once()
+		self.ads._dll.port_close.assert_called_once_with(self.PORT)
+
+	def test_without_session_opens_port_per_operation(self):
+		"""Test operations outside a session open and close their own port."""
+		self.ads.run_command("cmd.exe /c dir")
+		self.ads.run_command("cmd.exe /c dir")
+
+		self.assertEqual(self.ads._dll.port_open.call_count, 2)
+		self.assertEqual(self.ads._dll.port_close.call_count, 2)
+
+
+class TestCheckConnection(ADSTestCase):
 	"""Test ADSInterface.check_connection method."""
 
-	@patch('tcpkgman.ads_interface.get_ads_dll')
-	def test_connection_success(self, mock_get_dll):
+	def test_connection_success(self):
 		"""Test successful connection check."""
-		# Mock DLL
-		mock_dll = MagicMock()
-		mock_dll.port_open = MagicMock(return_value=12345)
-		mock_dll.port_close = MagicMock()
-		mock_dll.read_state = MagicMock(return_value=0)  # ADSERR_NOERR
-		mock_get_dll.return_value = mock_dll
-
-		# Create interface and check connection
-		ads = ADSInterface("192.168.100.117.1.1")
-		result = ads.check_connection()
+		self.mock_dll.read_state.return_value = 0  # ADSERR_NOERR
+
+		result = ADSInterface("192.168.100.117.1.1").check_connection()
 
-		# Verify
 		self.assertTrue(result)
-		mock_dll.port_open.assert_called_once()
-		mock_dll.read_state.assert_called_once()
-		mock_dll.port_close.assert_called_once_with(12345)
+		self.mock_dll.port_open.assert_called_once()
+		self.mock_dll.read_state.assert_called_once()
+		self.mock_dll.port_close.assert_called_once_with(self.PORT)
 
-	@patch('tcpkgman.ads_interface.get_ads_dll')
-	def test_connection_failure(self, mock_get_dll):
+	def test_connection_failure(self):
 		"""Test connection check with ADS error."""
 		from tcpkgman.ads_dll import ADSError
 
-		# Mock DLL
-		mock_dll = MagicMock()
-		mock_dll.port_open = MagicMock(return_value=12345)
-		mock_dll.port_close = MagicMock()
-		mock_dll.read_state = MagicMock(return_value=0x6)  # Target not found
-		mock_get_dll.return_value = mock_dll
-
-		# Create interface and check connection
+		self.mock_dll.read_state.return_value = 0x6  # Target not found
 		ads = ADSInterface("192.168.100.117.1.1")
 
 		with self.assertRaises(ADSError) as ctx:
@@ -286,7 +373,7 @@ class TestCheckConnection(unittest.TestCase):
 		self.assertEqual(ctx.exception.code, 0x6)
 
 		# Verify port was closed even after error
-		mock_dll.port_close.assert_called_once_with(12345)
+		self.mock_dll.port_close.assert_called_once_with(self.PORT)
 
 
 if __name__ == '__main__':
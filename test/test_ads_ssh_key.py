@@ -1,22 +1,28 @@
 """Tests for ADS SSH key manager."""
 
+import tempfile
 import unittest
-from unittest.mock import Mock, patch, MagicMock
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
 from tcpkgman.ads_ssh_key_manager import ADSSSHKeyManager
 from tcpkgman.ads_dll import AmsAddr
+try:
+	from .ads_test_case import ADSTestCase
+except ImportError:
+	# Test file run directly as a script rather than as part of the test package
+	from ads_test_case import ADSTestCase
 
 
-class TestReadSSHDPid(unittest.TestCase):
+@patch.object(ADSSSHKeyManager, 'read_file')
+class TestReadSSHDPid(ADSTestCase):
 	"""Test ADSSSHKeyManager._read_sshd_pid method."""
 
-	@patch('tcpkgman.ads_interface.get_ads_dll')
-	def setUp(self, mock_get_dll):
+	def setUp(self):
 		"""Create test instance."""
-		# Mock DLL loading
-		mock_get_dll.return_value = MagicMock()
+		super().setUp()
 		self.manager = ADSSSHKeyManager("192.168.100.117.1.1", "Administrator")
 
-	@patch.object(ADSSSHKeyManager, 'read_file')
 	def test_read_sshd_pid_success(self, mock_read_file):
 		"""Test reading valid PID file."""
 		mock_read_file.return_value = "1234\n"
@@ -24,14 +30,12 @@ class TestReadSSHDPid(unittest.TestCase):
 		self.assertEqual(pid, 1234)
 		mock_read_file.assert_called_once_with(ADSSSHKeyManager.PID_FILE_PATH)
 
-	@patch.object(ADSSSHKeyManager, 'read_file')
 	def test_read_sshd_pid_file_not_found(self, mock_read_file):
 		"""Test reading non-existent PID file."""
 		mock_read_file.side_effect = Exception("File not found")
 		pid = self.manager._read_sshd_pid()
 		self.assertIsNone(pid)
 
-	@patch.object(ADSSSHKeyManager, 'read_file')
 	def test_read_sshd_pid_invalid_content(self, mock_read_file):
 		"""Test reading PID file with invalid content."""
 		mock_read_file.return_value = "not a number"
@@ -39,25 +43,160 @@ class TestReadSSHDPid(unittest.TestCase):
 		self.assertIsNone(pid)
 
 
-class TestRestartOpenSSHServer(unittest.TestCase):
+class TestCopySSHKey(ADSTestCase):
+	"""Test ADSSSHKeyManager.copy_ssh_key method."""
+
+	def setUp(self):
+		"""Create test instance and local public key file."""
+		super().setUp()
+		self.manager = ADSSSHKeyManager("192.168.100.117.1.1", "Administrator")
+		self.tmp_dir = tempfile.TemporaryDirectory()
+		self.key_path = Path(self.tmp_dir.name) / "id_ed25519.pub"
+		self.key_path.write_text("ssh-ed25519 AAAANEW user@host\n")
+
+	def tearDown(self):
+		"""Remove local public key file."""
+		self.tmp_dir.cleanup()
+
+	@patch.object(ADSSSHKeyManager, 'write_file')
+	@patch.object(ADSSSHKeyManager, 'read_file')
+	def test_appends_to_existing_keys(self, mock_read_file, mock_write_file):
+		"""Test new key is appended after existing keys in a single write."""
+		mock_read_file.return_value = "ssh-rsa AAAAOLD admin@host"
+
+		self.manager.copy_ssh_key(str(self.key_path))
+
+		mock_read_file.assert_called_once_with(ADSSSHKeyManager.AUTHORIZED_KEYS_PATH)
+		mock_write_file.assert_called_once_with(
+			ADSSSHKeyManager.AUTHORIZED_KEYS_PATH,
+			"ssh-rsa AAAAOLD admin@host\nssh-ed25519 AAAANEW user@host\n"
+		)
+
+	@patch.object(ADSSSHKeyManager, 'write_file')
+	@patch.object(ADSSSHKeyManager, 'read_file')
+	def test_skips_write_when_key_present(self, mock_read_file, mock_write_file):
+		"""Test no write happens when key is already authorized."""
+		mock_read_file.return_value = "ssh-ed25519 AAAANEW user@host\n"
+
+		self.manager.copy_ssh_key(str(self.key_path))
+
+		mock_write_file.assert_not_called()
+
+	@patch.object(ADSSSHKeyManager, 'write_file')
+	@patch.object(ADSSSHKeyManager, 'read_file', return_value="")
+	def test_auto_detects_default_public_key(self, mock_read_file, mock_write_file):
+		"""Test default public key lookup is used when no key path is given."""
+		with patch.object(ADSSSHKeyManager, 'find_default_public_key', return_value=str(self.key_path)):
+			self.manager.copy_ssh_key()
+
+		mock_write_file.assert_called_once_with(
+			ADSSSHKeyManager.AUTHORIZED_KEYS_PATH,
+			"ssh-ed25519 AAAANEW user@host\n"
+		)
+
+	@patch.object(ADSSSHKeyManager, 'find_default_public_key', return_value=None)
+	def test_no_public_key_found(self, mock_find):
+		"""Test missing default public key raises FileNotFoundError."""
+		with self.assertRaises(FileNotFoundError):
+			self.manager.copy_ssh_key()
+
+	@patch.object(ADSSSHKeyManager, 'write_file')
+	@patch.object(ADSSSHKeyManager, 'read_file')
+	def test_creates_file_when_missing(self, mock_read_file, mock_write_file):
+		"""Test key file is created when authorized_keys cannot be read."""
+		mock_read_file.side_effect = Exception("File not found")
+
+		self.manager.copy_ssh_key(str(self.key_path))
+
+		mock_write_file.assert_called_once_with(
+			ADSSSHKeyManager.AUTHORIZED_KEYS_PATH,
+			"ssh-ed25519 AAAANEW user@host\n"
+		)
+
+
+class TestSSHConnectionProbe(ADSTestCase):
+	"""Test TCP probe before spawning ssh."""
+
+	def setUp(self):
+		"""Create test instance."""
+		super().setUp()
+		self.manager = ADSSSHKeyManager("192.168.1.100.1.1", "Administrator")
+
+	@patch('tcpkgman.ads_ssh_key_manager.time.sleep')
+	@patch('tcpkgman.ads_ssh_key_manager.subprocess.run')
+	@patch.object(ADSSSHKeyManager, '_probe_ssh_port', return_value=False)
+	def test_skips_ssh_when_port_closed(self, mock_probe, mock_run, mock_sleep):
+		"""Test ssh is not spawned while the target SSH port does not answer."""
+		result = self.manager.check_ssh_connection(max_retries=2)
+
+		self.assertFalse(result)
+		mock_probe.assert_called_with("192.168.1.100")
+		self.assertEqual(mock_probe.call_count, 2)
+		mock_sleep.assert_called_once_with(0.5)
+		mock_run.assert_not_called()
+
+	@patch('tcpkgman.ads_ssh_key_manager.subprocess.run')
+	@patch.object(ADSSSHKeyManager, '_probe_ssh_port', return_value=True)
+	def test_runs_ssh_when_port_open(self, mock_probe, mock_run):
+		"""Test ssh is spawned once SSH port answers."""
+		mock_run.return_value = SimpleNamespace(returncode=0)
+
+		result = self.manager.check_ssh_connection()
+
+		self.assertTrue(result)
+		mock_run.assert_called_once()
+
+	@patch('tcpkgman.ads_ssh_key_manager.subprocess.run')
+	@patch.object(ADSSSHKeyManager, '_probe_ssh_port')
+	def test_ssh_connection_not_probed(self, mock_probe, mock_run):
+		"""Test user-supplied hosts go straight to ssh, which may resolve them via ssh_config."""
+		mock_run.return_value = SimpleNamespace(returncode=0)
+
+		result = ADSSSHKeyManager.test_ssh_connection("myplc-alias", "Administrator", "22")
+
+		self.assertTrue(result)
+		mock_probe.assert_not_called()
+		mock_run.assert_called_once()
+
+	@patch('tcpkgman.ads_ssh_key_manager.time.sleep')
+	@patch('tcpkgman.ads_ssh_key_manager.subprocess.run')
+	def test_retries_with_backoff(self, mock_run, mock_sleep):
+		"""Test failed attempts back off exponentially up to the cap."""
+		mock_run.return_value = SimpleNamespace(returncode=255)
+
+		result = ADSSSHKeyManager.test_ssh_connection("192.168.1.100", "Administrator", "22", max_retries=5)
+
+		self.assertFalse(result)
+		self.assertEqual(mock_run.call_count, 5)
+		self.assertEqual([c[0][0] for c in mock_sleep.call_args_list], [0.5, 1, 2, 2])
+
+	@patch('tcpkgman.ads_ssh_key_manager.socket.create_connection')
+	def test_probe_checks_ssh_banner(self, mock_connect):
+		"""Test probe accepts only an SSH identification banner."""
+		sock = mock_connect.return_value.__enter__.return_value
+		sock.recv.return_value = b"SSH-2.0-OpenSSH_for_Windows"
+		self.assertTrue(ADSSSHKeyManager._probe_ssh_port("192.168.1.100", "22"))
+		mock_connect.assert_called_with(("192.168.1.100", 22), timeout=2)
+
+		sock.recv.return_value = b"HTTP/1.1"
+		self.assertFalse(ADSSSHKeyManager._probe_ssh_port("192.168.1.100", "22"))
+
+		mock_connect.side_effect = ConnectionRefusedError()
+		self.assertFalse(ADSSSHKeyManager._probe_ssh_port("192.168.1.100", "22"))
+
+
+class TestRestartOpenSSHServer(ADSTestCase):
 	"""Test ADSSSHKeyManager.restart_openssh_server method."""
 
-	@patch('tcpkgman.ads_interface.get_ads_dll')
-	def setUp(self, mock_get_dll):
+	def setUp(self):
 		"""Create test instance."""
-		# Mock DLL loading
-		mock_get_dll.return_value = MagicMock()
+		super().setUp()
 		self.manager = ADSSSHKeyManager("192.168.100.117.1.1", "Administrator")
 
 	@patch('tcpkgman.ads_ssh_key_manager.time.sleep')
 	@patch.object(ADSSSHKeyManager, '_read_sshd_pid')
 	def test_restart_success_first_poll(self, mock_read_pid, mock_sleep):
 		"""Test successful restart with PID change on first poll."""
-		# Mock DLL methods
-		self.manager._dll.port_open = MagicMock(return_value=12345)
-		self.manager._dll.port_close = MagicMock()
-		self.manager._dll.write = MagicMock()
-
 		# PID changes from 1234 to 5678 on first poll
 		mock_read_pid.side_effect = [1234, 5678]
 
@@ -69,8 +208,8 @@ class TestRestartOpenSSHServer(unittest.TestCase):
 		# Verify PID was read twice (before and after first poll)
 		self.assertEqual(mock_read_pid.call_count, 2)
 
-		# Verify sleep was called once (polling succeeded on first attempt)
-		mock_sleep.assert_called_once_with(1)
+		# Verify sleep was called once with the initial backoff delay
+		mock_sleep.assert_called_once_with(ADSSSHKeyManager.PID_POLL_INITIAL_DELAY)
 
 		# Verify exit code
 		self.assertEqual(exit_code, 0)
@@ -79,11 +218,6 @@ class TestRestartOpenSSHServer(unittest.TestCase):
 	@patch.object(ADSSSHKeyManager, '_read_sshd_pid')
 	def test_restart_success_after_retries(self, mock_read_pid, mock_sleep):
 		"""Test successful restart with PID change after several polls."""
-		# Mock DLL methods
-		self.manager._dll.port_open = MagicMock(return_value=12345)
-		self.manager._dll.port_close = MagicMock()
-		self.manager._dll.write = MagicMock()
-
 		# PID stays same for 3 polls, then changes on 4th
 		mock_read_pid.side_effect = [1234, 1234, 1234, 1234, 5678]
 
@@ -102,11 +236,6 @@ class TestRestartOpenSSHServer(unittest.TestCase):
 	@patch.object(ADSSSHKeyManager, '_read_sshd_pid')
 	def test_restart_failure_pid_unchanged(self, mock_read_pid, mock_sleep):
 		"""Test restart failure when PID doesn't change (timeout expires)."""
-		# Mock DLL methods
-		self.manager._dll.port_open = MagicMock(return_value=12345)
-		self.manager._dll.port_close = MagicMock()
-		self.manager._dll.write = MagicMock()
-
 		# PID stays the same (1234) throughout polling + final check
 		mock_read_pid.return_value = 1234
 
@@ -117,20 +246,19 @@ class TestRestartOpenSSHServer(unittest.TestCase):
 		self.assertIn("PID unchanged (1234)", error_msg)
 		self.assertIn("after 3s timeout", error_msg)
 
-		# Verify sleep was called 3 times (polling attempts)
-		self.assertEqual(mock_sleep.call_count, 3)
+		# Verify polling backed off up to the cap and waited the full timeout
+		delays = [c[0][0] for c in mock_sleep.call_args_list]
+		self.assertEqual(delays[0], ADSSSHKeyManager.PID_POLL_INITIAL_DELAY)
+		self.assertEqual(delays, sorted(delays))
+		self.assertEqual(max(delays), ADSSSHKeyManager.PID_POLL_MAX_DELAY)
+		self.assertGreaterEqual(sum(delays), 3)
 
 	@patch('tcpkgman.ads_ssh_key_manager.time.sleep')
 	@patch.object(ADSSSHKeyManager, '_read_sshd_pid')
 	def test_restart_failure_no_pid_after(self, mock_read_pid, mock_sleep):
 		"""Test restart failure when PID file missing after restart (timeout expires)."""
-		# Mock DLL methods
-		self.manager._dll.port_open = MagicMock(return_value=12345)
-		self.manager._dll.port_close = MagicMock()
-		self.manager._dll.write = MagicMock()
-
 		# PID exists before, missing throughout polling
-		mock_read_pid.side_effect = [1234] + [None] * 10  # Initial + polling attempts
+		mock_read_pid.side_effect = [1234] + [None] * 20  # Initial + polling attempts
 
 		with self.assertRaises(RuntimeError) as context:
 			self.manager.restart_openssh_server(timeout_ms=3000)
@@ -139,8 +267,9 @@ class TestRestartOpenSSHServer(unittest.TestCase):
 		self.assertIn("PID file not found", error_msg)
 		self.assertIn("after 3s timeout", error_msg)
 
-		# Verify sleep was called 3 times
-		self.assertEqual(mock_sleep.call_count, 3)
+		# Verify polling waited the full timeout
+		delays = [c[0][0] for c in mock_sleep.call_args_list]
+		self.assertGreaterEqual(sum(delays), 3)
 
 	@patch.object(ADSSSHKeyManager, '_read_sshd_pid')
 	def test_restart_no_pid_before(self, mock_read_pid):
@@ -159,11 +288,6 @@ class TestRestartOpenSSHServer(unittest.TestCase):
 	@patch.object(ADSSSHKeyManager, '_read_sshd_pid')
 	def test_restart_default_timeouts(self, mock_read_pid, mock_sleep):
 		"""Test default timeout values."""
-		# Mock DLL methods
-		self.manager._dll.port_open = MagicMock(return_value=12345)
-		self.manager._dll.port_close = MagicMock()
-		self.manager._dll.write = MagicMock()
-
 		# PID changes immediately
 		mock_read_pid.side_effect = [1234, 5678]
 
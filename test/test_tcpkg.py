@@ -3,50 +3,86 @@
 import sys
 import unittest
 from pathlib import Path
-from unittest.mock import Mock, patch, call
+from types import SimpleNamespace
+from unittest.mock import patch, call
 from tcpkgman.tcpkg import Tcpkg
 
+# subprocess.run results; callers only read these attributes
+_OK = SimpleNamespace(returncode=0, stdout="", stderr="")
+_LIST_TESTPLC = SimpleNamespace(returncode=0, stdout="testplc - Host: 192.168.1.100\n", stderr="")
+_LIST_OTHERPLC = SimpleNamespace(returncode=0, stdout="otherplc - Host: 192.168.1.100\n", stderr="")
+
 
 class TestTcpkg(unittest.TestCase):
 	"""Test Tcpkg thin wrapper functionality."""
 
-	@patch("subprocess.run")
-	def test_check_tcpkg_installed_success(self, mock_run):
+	def setUp(self):
+		"""Reset process-lifetime caches."""
+		Tcpkg._installed = False
+		Tcpkg._remote_exists_cache.clear()
+
+	@patch("shutil.which")
+	def test_check_tcpkg_installed_success(self, mock_which):
 		"""Test successful TcPkg installation check."""
-		mock_run.return_value = Mock(returncode=0)
+		mock_which.return_value = "C:/Program Files/Beckhoff/TcPkg/TcPkg.exe"
 		# Should not raise
 		Tcpkg.check_tcpkg_installed()
-		mock_run.assert_called_once()
+		mock_which.assert_called_once_with("TcPkg")
 
-	@patch("subprocess.run")
-	def test_check_tcpkg_installed_failure(self, mock_run):
+	@patch("shutil.which")
+	def test_check_tcpkg_installed_failure(self, mock_which):
 		"""Test TcPkg not installed."""
-		mock_run.side_effect = FileNotFoundError()
+		mock_which.return_value = None
 		with self.assertRaises(RuntimeError):
 			Tcpkg.check_tcpkg_installed()
 
 	@patch("subprocess.run")
 	def test_check_remote_exists_true(self, mock_run):
 		"""Test checking if remote exists (returns True)."""
-		mock_run.return_value = Mock(
-			returncode=0,
-			stdout="testplc - Host: 192.168.1.100\n"
-		)
+		mock_run.return_value = _LIST_TESTPLC
 		self.assertTrue(Tcpkg.check_remote_exists("testplc"))
 
 	@patch("subprocess.run")
 	def test_check_remote_exists_false(self, mock_run):
 		"""Test checking if remote exists (returns False)."""
-		mock_run.return_value = Mock(
+		mock_run.return_value = _LIST_OTHERPLC
+		self.assertFalse(Tcpkg.check_remote_exists("testplc"))
+
+	@patch("shutil.which")
+	def test_check_tcpkg_installed_cached(self, mock_which):
+		"""Test TcPkg installation is only probed once."""
+		mock_which.return_value = "C:/Program Files/Beckhoff/TcPkg/TcPkg.exe"
+		Tcpkg.check_tcpkg_installed()
+		Tcpkg.check_tcpkg_installed()
+		mock_which.assert_called_once()
+
+	@patch("subprocess.run")
+	def test_check_remote_exists_matches_whole_name(self, mock_run):
+		"""Test remote lookup matches indented lines and not name suffixes."""
+		mock_run.return_value = SimpleNamespace(
 			returncode=0,
-			stdout="otherplc - Host: 192.168.1.100\n"
+			stdout="Remotes:\n  my.plc - Host: 192.168.1.100\n  xmyplc - Host: 192.168.1.101\n"
 		)
+		self.assertTrue(Tcpkg.check_remote_exists("my.plc"))
+		self.assertFalse(Tcpkg.check_remote_exists("myplc"))
+
+	@patch("subprocess.run")
+	def test_check_remote_exists_cached_until_remove(self, mock_run):
+		"""Test remote lookup is cached and invalidated by remove_remote."""
+		# remote list, remote remove, then remote list again
+		mock_run.side_effect = [_LIST_TESTPLC, _OK, _OK]
+		self.assertTrue(Tcpkg.check_remote_exists("testplc"))
+		self.assertTrue(Tcpkg.check_remote_exists("testplc"))
+		self.assertEqual(mock_run.call_count, 1)
+
+		Tcpkg.remove_remote("testplc")
 		self.assertFalse(Tcpkg.check_remote_exists("testplc"))
+		self.assertEqual(mock_run.call_count, 3)
 
 	@patch("subprocess.run")
 	def test_run_with_remote_success(self, mock_run):
 		"""Test running command with remote."""
-		mock_run.return_value = Mock(returncode=0)
+		mock_run.return_value = _OK
 		Tcpkg.run_with_remote("testplc", ["install", "pkg"])
 		mock_run.assert_called_once_with(
 			["TcPkg", "install", "pkg", "-r", "testplc"]
@@ -55,7 +91,7 @@ class TestTcpkg(unittest.TestCase):
 	@patch("subprocess.run")
 	def test_add_remote_without_internet(self, mock_run):
 		"""Test adding remote without internet access."""
-		mock_run.return_value = Mock(returncode=0)
+		mock_run.return_value = _OK
 
 		Tcpkg.add_remote(
 			remote_name="testplc",
@@ -67,17 +103,17 @@ class TestTcpkg(unittest.TestCase):
 		)
 
 		mock_run.assert_called_once()
-		args = mock_run.call_args[0][0]
-		self.assertIn("TcPkg", args)
-		self.assertIn("remote", args)
-		self.assertIn("add", args)
-		self.assertIn("192.168.1.100", args)
-		self.assertNotIn("--internet-access", args)
+		argset = frozenset(mock_run.call_args[0][0])
+		self.assertIn("TcPkg", argset)
+		self.assertIn("remote", argset)
+		self.assertIn("add", argset)
+		self.assertIn("192.168.1.100", argset)
+		self.assertNotIn("--internet-access", argset)
 
 	@patch("subprocess.run")
 	def test_add_remote_with_internet(self, mock_run):
 		"""Test adding remote with internet access."""
-		mock_run.return_value = Mock(returncode=0)
+		mock_run.return_value = _OK
 
 		Tcpkg.add_remote(
 			remote_name="testplc",
@@ -89,14 +125,13 @@ class TestTcpkg(unittest.TestCase):
 		)
 
 		mock_run.assert_called_once()
-		call_args = mock_run.call_args
-		args = call_args[0][0]
-		self.assertIn("--internet-access", args)
+		argset = frozenset(mock_run.call_args[0][0])
+		self.assertIn("--internet-access", argset)
 
 	@patch("subprocess.run")
 	def test_remove_remote(self, mock_run):
 		"""Test removing remote."""
-		mock_run.return_value = Mock(returncode=0)
+		mock_run.return_value = _OK
 		Tcpkg.remove_remote("testplc")
 		mock_run.assert_called_once_with(
 			["TcPkg", "remote", "remove", "testplc"],
@@ -107,7 +142,7 @@ class TestTcpkg(unittest.TestCase):
 	@patch("subprocess.run")
 	def test_list_remotes(self, mock_run):
 		"""Test listing remotes."""
-		mock_run.return_value = Mock(returncode=0)
+		mock_run.return_value = _OK
 		Tcpkg.list_remotes()
 		mock_run.assert_called_once_with(["TcPkg", "remote", "list"])
 
@@ -3,154 +3,249 @@
 import sys
 import unittest
 from pathlib import Path
-from unittest.mock import Mock, patch
+from types import SimpleNamespace
+from unittest.mock import DEFAULT, Mock, patch
 from tcpkgman.tcpkgman import Tcpkgman
+from tcpkgman.ads_ssh_key_manager import ADSSSHKeyManager
 from tcpkgman.tcpkg import Tcpkg
+from tcpkgman import utils
+
+# Paths of the mocked home directory used by SSH key tests
+_TEST_HOME = Path("C:/Users/TestUser")
+_TEST_SSH = _TEST_HOME / ".ssh"
+_TEST_ED = _TEST_SSH / "id_ed25519"
+_TEST_RSA = _TEST_SSH / "id_rsa"
+
+
+class FastPatcher:
+	"""Swap a static method for a plain recording stub, without MagicMock."""
+
+	def __init__(self, target, name, return_value=None):
+		self.target = target
+		self.name = name
+		self.return_value = return_value
+		self.calls = []
+		self._original = None
+
+	def _stub(self, *args, **kwargs):
+		self.calls.append((args, kwargs))
+		return self.return_value
+
+	def start(self):
+		"""Install the stub and return the patcher for assertions."""
+		self._original = self.target.__dict__[self.name]
+		setattr(self.target, self.name, staticmethod(self._stub))
+		return self
+
+	def stop(self):
+		"""Restore the original static method."""
+		setattr(self.target, self.name, self._original)
+
+	def reset_mock(self):
+		"""Forget recorded calls."""
+		self.calls.clear()
+
+	def assert_not_called(self):
+		"""Assert the stub was never called."""
+		if self.calls:
+			raise AssertionError(f"Expected {self.name} not to be called. Called {len(self.calls)} times.")
+
+	def assert_called_once(self):
+		"""Assert the stub was called exactly once."""
+		if len(self.calls) != 1:
+			raise AssertionError(f"Expected {self.name} to be called once. Called {len(self.calls)} times.")
+
+	def assert_called_once_with(self, *args, **kwargs):
+		"""Assert the stub was called exactly once with the given arguments."""
+		self.assert_called_once()
+		if self.calls[0] != (args, kwargs):
+			raise AssertionError(f"Expected {self.name} call {(args, kwargs)}, got {self.calls[0]}")
 
 
 class BaseTestCase(unittest.TestCase):
 	"""Base test case with common helper methods."""
 
+	@classmethod
+	def setUpClass(cls):
+		"""Create one CLI instance shared by all tests of the class."""
+		cls.cli = Tcpkgman()
+
 	def setUp(self):
 		"""Set up test fixtures."""
-		self.cli = Tcpkgman()
+		utils.getenv.cache_clear()
+		utils._IS_ADMIN = None
+		# The parser is the only state run() keeps on the instance
+		self.cli.parser = None
 
 	def run_with_argv(self, argv):
 		"""Helper to run CLI with given argv."""
-		with patch.object(sys, "argv", ["tcpkgman"] + argv):
+		old_argv = sys.argv
+		sys.argv = ["tcpkgman"] + argv
+		try:
 			return self.cli.run()
+		finally:
+			sys.argv = old_argv
 
+	def fast_patch(self, target, name, return_value=None):
+		"""Stub a static method with FastPatcher until the test finishes."""
+		patcher = FastPatcher(target, name, return_value).start()
+		self.addCleanup(patcher.stop)
+		return patcher
 
-class TestCLICommands(BaseTestCase):
-	"""Test CLI command execution."""
+
+class TcpkgMockedMixin:
+	"""Stub the Tcpkg static methods used by pass-through commands."""
+
+	# Return value of the check_remote_exists stub
+	remote_exists = True
 
 	def setUp(self):
-		"""Set up test fixtures with mock Tcpkg static methods."""
+		"""Set up test fixtures with stubbed Tcpkg static methods."""
 		super().setUp()
-		self.check_installed_patcher = patch.object(Tcpkg, 'check_tcpkg_installed')
-		self.check_exists_patcher = patch.object(Tcpkg, 'check_remote_exists', return_value=True)
-		self.run_with_remote_patcher = patch.object(Tcpkg, 'run_with_remote')
+		self.mock_check_installed = self.fast_patch(Tcpkg, "check_tcpkg_installed")
+		self.mock_check_exists = self.fast_patch(Tcpkg, "check_remote_exists", return_value=self.remote_exists)
+		self.mock_run_with_remote = self.fast_patch(Tcpkg, "run_with_remote")
 
-		self.mock_check_installed = self.check_installed_patcher.start()
-		self.mock_check_exists = self.check_exists_patcher.start()
-		self.mock_run_with_remote = self.run_with_remote_patcher.start()
 
-	def tearDown(self):
-		"""Clean up patches."""
-		self.check_installed_patcher.stop()
-		self.check_exists_patcher.stop()
-		self.run_with_remote_patcher.stop()
-
-	def assert_command_passes_through(self, argv, expected_args):
-		"""Helper to test that a command passes args to tcpkg correctly."""
-		self.run_with_argv(argv)
-		self.mock_run_with_remote.assert_called_once_with("myplc", expected_args)
+class TestCLICommands(TcpkgMockedMixin, BaseTestCase):
+	"""Test CLI command execution."""
 
 	def test_install_command(self):
 		"""Test install command passes args correctly to tcpkg."""
 		self.run_with_argv(["--remote", "myplc", "install", "pkg1"])
 		self.mock_run_with_remote.assert_called_once_with("myplc", ["install", "pkg1"])
 
-	def test_list_command(self):
-		"""Test list command."""
-		self.assert_command_passes_through(
-			["--remote", "myplc", "list", "pkg1"],
-			["list", "pkg1"]
-		)
-
-	def test_upgrade_command(self):
-		"""Test upgrade command."""
-		self.assert_command_passes_through(
-			["--remote", "myplc", "upgrade", "pkg1"],
-			["upgrade", "pkg1"]
-		)
-
-	def test_uninstall_command(self):
-		"""Test uninstall command."""
-		self.assert_command_passes_through(
-			["--remote", "myplc", "uninstall", "pkg1"],
-			["uninstall", "pkg1"]
-		)
-
-	def test_show_command(self):
-		"""Test show command."""
-		self.assert_command_passes_through(
-			["--remote", "myplc", "show", "pkg1"],
-			["show", "pkg1"]
-		)
-
-	def test_command_with_multiple_packages(self):
-		"""Test command with multiple packages."""
-		self.assert_command_passes_through(
-			["--remote", "myplc", "install", "pkg1", "pkg2", "pkg3"],
-			["install", "pkg1", "pkg2", "pkg3"]
-		)
-
-	def test_command_with_flags(self):
-		"""Test command with tcpkg flags passed through."""
-		self.assert_command_passes_through(
-			["--remote", "myplc", "install", "pkg1", "--version", "1.0.0"],
-			["install", "pkg1", "--version", "1.0.0"]
-		)
-
-
+	def test_commands_pass_through(self):
+		"""Test commands, multiple packages and tcpkg flags are passed through to tcpkg."""
+		cases = [
+			["list", "pkg1"],
+			["upgrade", "pkg1"],
+			["uninstall", "pkg1"],
+			["show", "pkg1"],
+			["install", "pkg1", "pkg2", "pkg3"],
+			["install", "pkg1", "--version", "1.0.0"],
+		]
+		for command in cases:
+			with self.subTest(command=command):
+				self.mock_run_with_remote.reset_mock()
+				self.run_with_argv(["--remote", "myplc"] + command)
+				self.mock_run_with_remote.assert_called_once_with("myplc", command)
+
+
+class TestArgvSniffing(BaseTestCase):
+	"""Test choosing between pass-through and full argument parser."""
+
+	def test_needs_full_parser(self):
+		"""Test management options and help select the full parser."""
+		cases = [
+			(["--remote", "myplc", "install", "pkg"], False),
+			(["install", "pkg", "--version", "1.0.0"], False),
+			([], False),
+			(["--remote-add", "myplc"], True),
+			(["--remote-list"], True),
+			(["--remote-ssh-init"], True),
+			(["--remote=myplc", "install", "pkg"], False),
+			(["--rem", "myplc", "install", "pkg"], True),
+			(["--remo=myplc", "install", "pkg"], True),
+			(["-h"], True),
+			(["--help"], True),
+		]
+		for argv, expected in cases:
+			with self.subTest(argv=argv):
+				self.assertEqual(Tcpkgman._needs_full_parser(argv), expected)
+
+	def test_fast_parse(self):
+		"""Test pass-through argv is split into remote and TcPkg arguments."""
+		cases = [
+			(["--remote", "myplc", "install", "pkg"], "myplc", ["install", "pkg"]),
+			(["--remote=myplc", "install", "pkg"], "myplc", ["install", "pkg"]),
+			(["install", "pkg", "--remote", "myplc"], "myplc", ["install", "pkg"]),
+			(["install", "pkg", "--version", "1.0.0"], None, ["install", "pkg", "--version", "1.0.0"]),
+		]
+		for argv, remote, remaining in cases:
+			with self.subTest(argv=argv):
+				args, rest = Tcpkgman._fast_parse(argv)
+				self.assertEqual(args.remote, remote)
+				self.assertEqual(rest, remaining)
+				self.assertIsNone(args.remote_add)
+				self.assertFalse(args.remote_list)
+
+	def test_fast_parse_falls_back_to_argparse(self):
+		"""Test ambiguous argv is left to argparse."""
+		for argv in (["--remote"], ["--remote", "-x"], ["--rem", "myplc", "install"], ["--remo=myplc", "install"], ["--", "install"]):
+			with self.subTest(argv=argv):
+				self.assertIsNone(Tcpkgman._fast_parse(argv))
+
+	def test_help_only_invocations(self):
+		"""Test empty argv, -h and --help print full help without parsing."""
+		for argv in ([], ["-h"], ["--help"]):
+			with self.subTest(argv=argv):
+				with patch("sys.stdout") as mock_stdout, \
+					 patch("argparse.ArgumentParser.parse_known_args") as mock_parse:
+					with self.assertRaises(SystemExit) as cm:
+						self.run_with_argv(argv)
+				self.assertEqual(cm.exception.code, 0)
+				mock_parse.assert_not_called()
+				output = "".join(c[0][0] for c in mock_stdout.write.call_args_list)
+				self.assertIn("--remote-ssh-init", output)
+
+	def test_help_without_command_uses_full_parser(self):
+		"""Test help printed for missing command lists management options."""
+		with patch("sys.stdout") as mock_stdout:
+			with self.assertRaises(SystemExit):
+				self.run_with_argv(["--remote", "myplc"])
+		output = "".join(c[0][0] for c in mock_stdout.write.call_args_list)
+		self.assertIn("--remote-add", output)
+
+
+@patch("ctypes.windll.shell32.IsUserAnAdmin", new=Mock(return_value=True))
+@patch.multiple(Tcpkgman, _add_remote_interactive=DEFAULT)
 class TestRemoteManagement(BaseTestCase):
 	"""Test remote add/remove functionality."""
 
 	def setUp(self):
-		"""Set up test fixtures with mock Tcpkg static methods."""
+		"""Set up test fixtures with stubbed Tcpkg static methods."""
 		super().setUp()
-		self.check_installed_patcher = patch.object(Tcpkg, 'check_tcpkg_installed')
-		self.check_exists_patcher = patch.object(Tcpkg, 'check_remote_exists')
-		self.remove_remote_patcher = patch.object(Tcpkg, 'remove_remote')
-		self.list_remotes_patcher = patch.object(Tcpkg, 'list_remotes')
-
-		self.mock_check_installed = self.check_installed_patcher.start()
-		self.mock_check_exists = self.check_exists_patcher.start()
-		self.mock_remove_remote = self.remove_remote_patcher.start()
-		self.mock_list_remotes = self.list_remotes_patcher.start()
-
-		# Mock admin check and interactive methods
-		self.mock_admin_patcher = patch("ctypes.windll.shell32.IsUserAnAdmin", return_value=True)
-		self.mock_admin_patcher.start()
-		self.mock_add_remote_patcher = patch.object(Tcpkgman, "_add_remote_interactive")
-		self.mock_add_remote = self.mock_add_remote_patcher.start()
+		self.mock_check_installed = self.fast_patch(Tcpkg, "check_tcpkg_installed")
+		self.mock_check_exists = self.fast_patch(Tcpkg, "check_remote_exists", return_value=False)
+		self.mock_remove_remote = self.fast_patch(Tcpkg, "remove_remote")
+		self.mock_list_remotes = self.fast_patch(Tcpkg, "list_remotes")
 
-	def tearDown(self):
-		"""Clean up patches."""
-		self.check_installed_patcher.stop()
-		self.check_exists_patcher.stop()
-		self.remove_remote_patcher.stop()
-		self.list_remotes_patcher.stop()
-		self.mock_admin_patcher.stop()
-		self.mock_add_remote_patcher.stop()
-
-	def test_remote_add_new(self):
+	def test_remote_add_new(self, _add_remote_interactive):
 		"""Test adding a new remote."""
-		self.mock_check_exists.return_value = False
 		self.run_with_argv(["--remote-add", "myplc"])
 
 		self.mock_check_installed.assert_called_once()
 		self.mock_check_exists.assert_called_once_with("myplc")
-		self.mock_add_remote.assert_called_once()
+		_add_remote_interactive.assert_called_once()
+
+	@patch("tcpkgman.utils.input", create=True, return_value="myplc")
+	def test_remote_add_prompts_for_name(self, mock_input, _add_remote_interactive):
+		"""Test --remote-add without a name prompts for it."""
+		self.run_with_argv(["--remote-add"])
+
+		mock_input.assert_called_once()
+		self.mock_check_installed.assert_called_once()
+		self.mock_check_exists.assert_called_once_with("myplc")
+		_add_remote_interactive.assert_called_once_with("myplc", skip_confirmation=True)
 
 	@patch("builtins.print")
-	def test_remote_add_existing(self, mock_print):
+	def test_remote_add_existing(self, mock_print, _add_remote_interactive):
 		"""Test adding an existing remote."""
 		self.mock_check_exists.return_value = True
 		self.run_with_argv(["--remote-add", "myplc"])
 
 		mock_print.assert_called_with("Remote 'myplc' already exists")
-		self.mock_add_remote.assert_not_called()
+		_add_remote_interactive.assert_not_called()
 
-	def test_remote_remove(self):
+	def test_remote_remove(self, **_):
 		"""Test removing a remote."""
 		self.run_with_argv(["--remote-remove", "myplc"])
 
 		self.mock_check_installed.assert_called_once()
 		self.mock_remove_remote.assert_called_once_with("myplc")
 
-	def test_remote_list(self):
+	def test_remote_list(self, **_):
 		"""Test listing all remotes."""
 		self.run_with_argv(["--remote-list"])
 
@@ -183,6 +278,14 @@ class TestErrorCases(BaseTestCase):
 		"""Test that help is printed when no command is specified."""
 		self.assert_exits_with_code(["--remote", "myplc"], 0)
 
+	@patch("sys.stderr")
+	def test_ambiguous_remote_abbreviation(self, mock_stderr):
+		"""Test abbreviated --remote is rejected as ambiguous like the full parser does."""
+		for argv in (["--rem", "myplc", "install", "pkg"], ["--remo=myplc", "install", "pkg"]):
+			with self.subTest(argv=argv):
+				self.cli.parser = None
+				self.assert_exits_with_code(argv, 2)
+
 	def test_keyboard_interrupt(self):
 		"""Test handling of keyboard interrupt."""
 		with patch.object(Tcpkg, 'check_tcpkg_installed'):
@@ -190,60 +293,24 @@ class TestErrorCases(BaseTestCase):
 				self.assert_exits_with_code(["--remote", "myplc", "install", "pkg"], 130)
 
 
-class TestRemoteCreation(BaseTestCase):
+@patch.multiple(Tcpkgman, _add_remote_interactive=DEFAULT)
+class TestRemoteCreation(TcpkgMockedMixin, BaseTestCase):
 	"""Test automatic remote creation."""
 
-	def setUp(self):
-		"""Set up test fixtures with mock Tcpkg static methods."""
-		super().setUp()
-		self.check_installed_patcher = patch.object(Tcpkg, 'check_tcpkg_installed')
-		self.check_exists_patcher = patch.object(Tcpkg, 'check_remote_exists', return_value=False)
-		self.run_with_remote_patcher = patch.object(Tcpkg, 'run_with_remote')
-
-		self.mock_check_installed = self.check_installed_patcher.start()
-		self.mock_check_exists = self.check_exists_patcher.start()
-		self.mock_run_with_remote = self.run_with_remote_patcher.start()
+	remote_exists = False
 
-		# Mock interactive method
-		self.mock_add_remote_patcher = patch.object(Tcpkgman, "_add_remote_interactive")
-		self.mock_add_remote = self.mock_add_remote_patcher.start()
-
-	def tearDown(self):
-		"""Clean up patches."""
-		self.check_installed_patcher.stop()
-		self.check_exists_patcher.stop()
-		self.run_with_remote_patcher.stop()
-		self.mock_add_remote_patcher.stop()
-
-	def test_auto_add_remote_when_missing(self):
+	def test_auto_add_remote_when_missing(self, _add_remote_interactive):
 		"""Test that remote is automatically added if it doesn't exist."""
 		self.run_with_argv(["--remote", "myplc", "install", "pkg"])
 
 		# Should add the remote before running the command
-		self.mock_add_remote.assert_called_once()
+		_add_remote_interactive.assert_called_once()
 		self.mock_run_with_remote.assert_called_once_with("myplc", ["install", "pkg"])
 
 
-class TestEnvironmentVariable(BaseTestCase):
+class TestEnvironmentVariable(TcpkgMockedMixin, BaseTestCase):
 	"""Test TCPKG_REMOTE environment variable."""
 
-	def setUp(self):
-		"""Set up test fixtures with mock Tcpkg static methods."""
-		super().setUp()
-		self.check_installed_patcher = patch.object(Tcpkg, 'check_tcpkg_installed')
-		self.check_exists_patcher = patch.object(Tcpkg, 'check_remote_exists', return_value=True)
-		self.run_with_remote_patcher = patch.object(Tcpkg, 'run_with_remote')
-
-		self.mock_check_installed = self.check_installed_patcher.start()
-		self.mock_check_exists = self.check_exists_patcher.start()
-		self.mock_run_with_remote = self.run_with_remote_patcher.start()
-
-	def tearDown(self):
-		"""Clean up patches."""
-		self.check_installed_patcher.stop()
-		self.check_exists_patcher.stop()
-		self.run_with_remote_patcher.stop()
-
 	@patch.dict('os.environ', {'TCPKG_REMOTE': 'envplc'})
 	def test_env_var_used_when_no_flag(self):
 		"""Test that TCPKG_REMOTE is used when --remote is not provided."""
@@ -266,67 +333,70 @@ class TestEnvironmentVariable(BaseTestCase):
 		self.assertEqual(cm.exception.code, 1)
 
 
+@patch("pathlib.Path.home", new=Mock(return_value=_TEST_HOME))
 class TestSSHKeyManagement(unittest.TestCase):
 	"""Test SSH key detection and generation functionality."""
 
-	@patch("pathlib.Path.home")
-	def test_get_ssh_dir(self, mock_home):
+	def setUp(self):
+		"""Reset cached SSH directory and key lookups."""
+		ADSSSHKeyManager.clear_key_cache()
+
+	def tearDown(self):
+		"""Drop lookups cached against mocked paths."""
+		ADSSSHKeyManager.clear_key_cache()
+
+	@staticmethod
+	def _patch_existing_paths(*paths):
+		"""Patch Path.exists to report only the given paths as existing."""
+		present = frozenset(paths)
+
+		def mock_exists(path):
+			return path in present
+
+		return patch.object(Path, "exists", mock_exists)
+
+	def test_get_ssh_dir(self):
 		"""Test getting SSH directory path."""
-		from tcpkgman.ads_ssh_key_manager import ADSSSHKeyManager
-		mock_home.return_value = Path("C:/Users/TestUser")
 		ssh_dir = ADSSSHKeyManager.get_ssh_dir()
-		self.assertEqual(ssh_dir, Path("C:/Users/TestUser/.ssh"))
+		self.assertEqual(ssh_dir, _TEST_SSH)
 
-	@patch("pathlib.Path.home")
-	def test_find_default_ssh_key_ed25519(self, mock_home):
+	def test_find_default_ssh_key_ed25519(self):
 		"""Test finding ed25519 key (preferred)."""
-		from tcpkgman.ads_ssh_key_manager import ADSSSHKeyManager
-		mock_home.return_value = Path("C:/Users/TestUser")
-
-		# Mock exists to return True for ed25519
-		def mock_exists(self):
-			return str(self).endswith("id_ed25519")
-
-		with patch.object(Path, "exists", mock_exists):
+		with self._patch_existing_paths(_TEST_ED, _TEST_RSA):
 			key = ADSSSHKeyManager.find_default_key()
-			self.assertTrue(key.endswith("id_ed25519"))
-
-	@patch("pathlib.Path.home")
-	def test_find_default_ssh_key_rsa(self, mock_home):
-		"""Test finding rsa key when ed25519 doesn't exist."""
-		from tcpkgman.ads_ssh_key_manager import ADSSSHKeyManager
-		mock_home.return_value = Path("C:/Users/TestUser")
+			self.assertEqual(key, str(_TEST_ED))
 
-		# Mock exists to return True only for rsa
-		def mock_exists(self):
-			return str(self).endswith("id_rsa")
+		# Cached lookup does not touch the filesystem again
+		with patch.object(Path, "exists", side_effect=AssertionError("unexpected stat")):
+			self.assertEqual(ADSSSHKeyManager.find_default_key(), key)
 
-		with patch.object(Path, "exists", mock_exists):
+	def test_find_default_ssh_key_rsa(self):
+		"""Test finding rsa key when ed25519 doesn't exist."""
+		with self._patch_existing_paths(_TEST_RSA):
 			key = ADSSSHKeyManager.find_default_key()
-			self.assertTrue(key.endswith("id_rsa"))
+			self.assertEqual(key, str(_TEST_RSA))
 
-	@patch("pathlib.Path.home")
-	def test_find_default_ssh_key_none(self, mock_home):
+	def test_find_default_ssh_key_none(self):
 		"""Test when no default SSH keys exist."""
-		from tcpkgman.ads_ssh_key_manager import ADSSSHKeyManager
-		mock_home.return_value = Path("C:/Users/TestUser")
-
-		with patch("pathlib.Path.exists", return_value=False):
+		with self._patch_existing_paths():
 			key = ADSSSHKeyManager.find_default_key()
 			self.assertIsNone(key)
 
-	@patch("pathlib.Path.home")
 	@patch("subprocess.run")
 	@patch("builtins.print")
-	def test_generate_ssh_key_success(self, mock_print, mock_run, mock_home):
+	def test_generate_ssh_key_success(self, mock_print, mock_run):
 		"""Test successful SSH key generation."""
-		from tcpkgman.ads_ssh_key_manager import ADSSSHKeyManager
-		mock_home.return_value = Path("C:/Users/TestUser")
-		mock_run.return_value = Mock(returncode=0)
+		mock_run.return_value = SimpleNamespace(returncode=0, stderr="")
+
+		with patch("pathlib.Path.exists", return_value=False):
+			self.assertIsNone(ADSSSHKeyManager.find_default_key())
 
 		with patch("pathlib.Path.mkdir"):
 			key_path = ADSSSHKeyManager.generate_key("ed25519")
-			self.assertTrue(key_path.endswith("id_ed25519"))
+			self.assertEqual(key_path, str(_TEST_ED))
+
+			# Verify default key lookups are re-evaluated after generation
+			self.assertEqual(ADSSSHKeyManager.find_default_key.cache_info().currsize, 0)
 
 			# Verify ssh-keygen was called with correct args
 			args = mock_run.call_args[0][0]
@@ -334,13 +404,10 @@ class TestSSHKeyManagement(unittest.TestCase):
 			self.assertEqual(args[1], "-t")
 			self.assertEqual(args[2], "ed25519")
 
-	@patch("pathlib.Path.home")
 	@patch("subprocess.run")
-	def test_generate_ssh_key_failure(self, mock_run, mock_home):
+	def test_generate_ssh_key_failure(self, mock_run):
 		"""Test SSH key generation failure handling."""
-		from tcpkgman.ads_ssh_key_manager import ADSSSHKeyManager
-		mock_home.return_value = Path("C:/Users/TestUser")
-		mock_run.return_value = Mock(returncode=1, stderr="Error message")
+		mock_run.return_value = SimpleNamespace(returncode=1, stderr="Error message")
 
 		with patch("pathlib.Path.mkdir"):
 			with self.assertRaises(RuntimeError) as cm:
@@ -351,7 +418,7 @@ class TestSSHKeyManagement(unittest.TestCase):
 class TestSSHConnectionCheck(BaseTestCase):
 	"""Test SSH connection checking in remote add."""
 
-	@patch("pathlib.Path.exists")
+	@patch("os.path.exists")
 	def test_check_ssh_setup_key_missing(self, mock_exists):
 		"""Test SSH check when key file doesn't exist."""
 		mock_exists.return_value = False
@@ -361,7 +428,7 @@ class TestSSHConnectionCheck(BaseTestCase):
 		self.assertFalse(result)
 
 	@patch("tcpkgman.ads_ssh_key_manager.ADSSSHKeyManager.test_ssh_connection")
-	@patch("pathlib.Path.exists")
+	@patch("os.path.exists")
 	def test_check_ssh_setup_connection_success(self, mock_exists, mock_test_ssh):
 		"""Test SSH check when connection succeeds."""
 		mock_exists.return_value = True
@@ -373,7 +440,7 @@ class TestSSHConnectionCheck(BaseTestCase):
 		mock_test_ssh.assert_called_once_with("192.168.1.100", "Administrator", "22", "C:/Users/test/.ssh/id_ed25519")
 
 	@patch("tcpkgman.ads_ssh_key_manager.ADSSSHKeyManager.test_ssh_connection")
-	@patch("pathlib.Path.exists")
+	@patch("os.path.exists")
 	def test_check_ssh_setup_connection_failed(self, mock_exists, mock_test_ssh):
 		"""Test SSH check when connection fails."""
 		mock_exists.return_value = True
@@ -383,20 +450,16 @@ class TestSSHConnectionCheck(BaseTestCase):
 
 		self.assertFalse(result)
 
-	@patch("builtins.input")
+	@patch("tcpkgman.tcpkgman.input", create=True, return_value="y")
 	def test_offer_ssh_init_via_ads_accepted(self, mock_input):
 		"""Test offering SSH init via ADS when user accepts."""
-		mock_input.return_value = "y"
-
 		result = self.cli._offer_ssh_init_via_ads()
 
 		self.assertTrue(result)
 
-	@patch("builtins.input")
+	@patch("tcpkgman.tcpkgman.input", create=True, return_value="n")
 	def test_offer_ssh_init_via_ads_declined(self, mock_input):
 		"""Test offering SSH init via ADS when user declines."""
-		mock_input.return_value = "n"
-
 		result = self.cli._offer_ssh_init_via_ads()
 
 		self.assertFalse(result)
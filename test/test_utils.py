@@ -0,0 +1,76 @@
+"""Tests for utility functions."""
+
+import unittest
+from unittest.mock import patch
+from tcpkgman import utils
+from tcpkgman.utils import Utils, MARK_DEFAULT, MARK_OTHER, DIM, RESET
+
+
+class TestChoice(unittest.TestCase):
+	"""Test Utils.choice method."""
+
+	@patch("sys.stdout")
+	@patch("builtins.print")
+	@patch("builtins.input", return_value="")
+	def test_empty_input_returns_default(self, mock_input, mock_print, mock_stdout):
+		"""Test empty input selects the default choice."""
+		self.assertEqual(Utils.choice("Pick:", ["a", "b", "c"], default_index=1), "b")
+
+	@patch("sys.stdout")
+	@patch("builtins.input", return_value="")
+	def test_menu_written_once(self, mock_input, mock_stdout):
+		"""Test menu is written in a single call with the default marked."""
+		Utils.choice("Pick:", ["a", "b"], default_index=1)
+
+		mock_stdout.write.assert_called_once()
+		menu = mock_stdout.write.call_args[0][0]
+		self.assertIn("Pick:", menu)
+		self.assertIn(f"  {MARK_OTHER} {DIM}1.{RESET} a\n", menu)
+		self.assertIn(f"  {MARK_DEFAULT} {DIM}2.{RESET} b\n", menu)
+
+	@patch("sys.stdout")
+	@patch("builtins.print")
+	@patch("builtins.input", return_value="3")
+	def test_number_selects_choice(self, mock_input, mock_print, mock_stdout):
+		"""Test entered number selects the matching choice."""
+		self.assertEqual(Utils.choice("Pick:", ["a", "b", "c"]), "c")
+
+	@patch("sys.stdout")
+	@patch("builtins.print")
+	@patch("builtins.input", side_effect=["x", "0", "4", "²", "2"])
+	def test_retries_on_invalid_input(self, mock_input, mock_print, mock_stdout):
+		"""Test invalid and out-of-range input is rejected until a valid number is given."""
+		self.assertEqual(Utils.choice("Pick:", ["a", "b", "c"]), "b")
+
+		self.assertEqual(mock_input.call_count, 5)
+		messages = [c[0][0] for c in mock_print.call_args_list]
+		self.assertEqual(messages.count("Please enter a valid number"), 2)
+		self.assertEqual(messages.count("Please enter a number between 1 and 3"), 2)
+
+	@patch("sys.stdout")
+	@patch("builtins.print")
+	@patch("builtins.input", side_effect=["", "2"])
+	def test_return_index(self, mock_input, mock_print, mock_stdout):
+		"""Test return_index returns the zero-based index instead of the option."""
+		self.assertEqual(Utils.choice("Pick:", ["a", "b", "c"], default_index=2, return_index=True), 2)
+		self.assertEqual(Utils.choice("Pick:", ["a", "b", "c"], return_index=True), 1)
+
+
+class TestCheckAdminPrivileges(unittest.TestCase):
+	"""Test Utils.check_admin_privileges method."""
+
+	def setUp(self):
+		"""Clear the cached administrator check."""
+		utils._IS_ADMIN = None
+		self.addCleanup(setattr, utils, "_IS_ADMIN", None)
+
+	def test_admin_check_cached(self):
+		"""Test administrator check calls the Windows API only once."""
+		with patch("ctypes.windll.shell32.IsUserAnAdmin", return_value=True) as mock_is_admin:
+			Utils.check_admin_privileges()
+			Utils.check_admin_privileges()
+		mock_is_admin.assert_called_once()
+
+
+if __name__ == "__main__":
+	unittest.main()